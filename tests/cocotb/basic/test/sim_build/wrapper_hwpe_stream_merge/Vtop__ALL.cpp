@@ -0,0 +1,16 @@
+// DESCRIPTION: Generated by verilator_includer via makefile
+#define VL_INCLUDE_OPT include
+#include "Vtop.cpp"
+#include "Vtop___024root__0.cpp"
+#include "Vtop_hwpe_stream_intf_stream__D10__0.cpp"
+#include "Vtop_hwpe_stream_intf_stream__D40__0.cpp"
+#include "Vtop__Dpi.cpp"
+#include "Vtop___024root__Slow.cpp"
+#include "Vtop___024root__0__Slow.cpp"
+#include "Vtop___024unit__Slow.cpp"
+#include "Vtop_hwpe_stream_package__Slow.cpp"
+#include "Vtop_hwpe_stream_intf_stream__D10__Slow.cpp"
+#include "Vtop_hwpe_stream_intf_stream__D10__0__Slow.cpp"
+#include "Vtop_hwpe_stream_intf_stream__D40__Slow.cpp"
+#include "Vtop_hwpe_stream_intf_stream__D40__0__Slow.cpp"
+#include "Vtop__Syms__Slow.cpp"
@@ -0,0 +1,162 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+Vtop__Syms::Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp)
+    : VerilatedSyms{contextp}
+    // Setup internal state of the Syms class
+    , __Vm_modelp{modelp}
+    // Setup top module instance
+    , TOP{this, namep}
+{
+    // Check resources
+    Verilated::stackCheck(124);
+    // Setup sub module instances
+    TOP__hwpe_stream_package.ctor(this, "hwpe_stream_package");
+    TOP__wrapper_hwpe_stream_merge__DOT__pop_o.ctor(this, "wrapper_hwpe_stream_merge.pop_o");
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.ctor(this, "wrapper_hwpe_stream_merge.push_i[0]");
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.ctor(this, "wrapper_hwpe_stream_merge.push_i[1]");
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.ctor(this, "wrapper_hwpe_stream_merge.push_i[2]");
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.ctor(this, "wrapper_hwpe_stream_merge.push_i[3]");
+    // Configure time unit / time precision
+    _vm_contextp__->timeunit(-12);
+    _vm_contextp__->timeprecision(-12);
+    // Setup each module's pointers to their submodules
+    TOP.__PVT__hwpe_stream_package = &TOP__hwpe_stream_package;
+    TOP.__PVT__wrapper_hwpe_stream_merge__DOT__pop_o = &TOP__wrapper_hwpe_stream_merge__DOT__pop_o;
+    TOP.__PVT__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__ = &TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__;
+    TOP.__PVT__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__ = &TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__;
+    TOP.__PVT__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__ = &TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__;
+    TOP.__PVT__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__ = &TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__;
+    // Setup each module's pointer back to symbol table (for public functions)
+    TOP.__Vconfigure(true);
+    TOP__hwpe_stream_package.__Vconfigure(true);
+    TOP__wrapper_hwpe_stream_merge__DOT__pop_o.__Vconfigure(true);
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.__Vconfigure(true);
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.__Vconfigure(false);
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.__Vconfigure(false);
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.__Vconfigure(false);
+    // Setup scopes
+    __Vscopep_hwpe_stream_package = new VerilatedScope{this, "hwpe_stream_package", "hwpe_stream_package", "hwpe_stream_package", -12, VerilatedScope::SCOPE_PACKAGE};
+    __Vscopep_wrapper_hwpe_stream_merge = new VerilatedScope{this, "wrapper_hwpe_stream_merge", "wrapper_hwpe_stream_merge", "wrapper_hwpe_stream_merge", -12, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge = new VerilatedScope{this, "wrapper_hwpe_stream_merge.dut_hwpe_stream_merge", "dut_hwpe_stream_merge", "hwpe_stream_merge", -12, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_wrapper_hwpe_stream_merge__pop_o = new VerilatedScope{this, "wrapper_hwpe_stream_merge.pop_o", "pop_o", "hwpe_stream_intf_stream", -12, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__ = new VerilatedScope{this, "wrapper_hwpe_stream_merge.push_i[0]", "push_i[0]", "hwpe_stream_intf_stream", -12, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__ = new VerilatedScope{this, "wrapper_hwpe_stream_merge.push_i[1]", "push_i[1]", "hwpe_stream_intf_stream", -12, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__ = new VerilatedScope{this, "wrapper_hwpe_stream_merge.push_i[2]", "push_i[2]", "hwpe_stream_intf_stream", -12, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__ = new VerilatedScope{this, "wrapper_hwpe_stream_merge.push_i[3]", "push_i[3]", "hwpe_stream_intf_stream", -12, VerilatedScope::SCOPE_MODULE};
+    // Set up scope hierarchy
+    __Vhier.add(0, __Vscopep_hwpe_stream_package);
+    __Vhier.add(0, __Vscopep_wrapper_hwpe_stream_merge);
+    __Vhier.add(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge);
+    __Vhier.add(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__pop_o);
+    __Vhier.add(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__);
+    __Vhier.add(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__);
+    __Vhier.add(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__);
+    __Vhier.add(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__);
+    // Setup export functions - final: 0
+    // Setup export functions - final: 1
+    // Setup public variables
+    __Vscopep_hwpe_stream_package->varInsert("HWPE_STREAM_REALIGN_SINK", const_cast<void*>(static_cast<const void*>(&(TOP__hwpe_stream_package.HWPE_STREAM_REALIGN_SINK))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_hwpe_stream_package->varInsert("HWPE_STREAM_REALIGN_SOURCE", const_cast<void*>(static_cast<const void*>(&(TOP__hwpe_stream_package.HWPE_STREAM_REALIGN_SOURCE))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_hwpe_stream_package->varInsert("NB_SERDES_STREAMS_MAX", const_cast<void*>(static_cast<const void*>(&(TOP__hwpe_stream_package.NB_SERDES_STREAMS_MAX))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_merge__DOT__DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("DATA_WIDTH_O", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_merge__DOT__DATA_WIDTH_O))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("NB_IN_STREAMS", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_merge__DOT__NB_IN_STREAMS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("STRB_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_merge__DOT__STRB_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("STRB_WIDTH_O", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_merge__DOT__STRB_WIDTH_O))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("clear_i", &(TOP.wrapper_hwpe_stream_merge__DOT__clear_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("clk_i", &(TOP.wrapper_hwpe_stream_merge__DOT__clk_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("data_i", &(TOP.wrapper_hwpe_stream_merge__DOT__data_i), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,3,0 ,15,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("data_o", &(TOP.wrapper_hwpe_stream_merge__DOT__data_o), false, VLVT_UINT64, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,63,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("ready_i", &(TOP.wrapper_hwpe_stream_merge__DOT__ready_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 1, 1 ,3,0 ,0,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("ready_o", &(TOP.wrapper_hwpe_stream_merge__DOT__ready_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("rst_ni", &(TOP.wrapper_hwpe_stream_merge__DOT__rst_ni), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("strb_i", &(TOP.wrapper_hwpe_stream_merge__DOT__strb_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,3,0 ,1,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("strb_o", &(TOP.wrapper_hwpe_stream_merge__DOT__strb_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("valid_i", &(TOP.wrapper_hwpe_stream_merge__DOT__valid_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,3,0 ,0,0);
+    __Vscopep_wrapper_hwpe_stream_merge->varInsert("valid_o", &(TOP.wrapper_hwpe_stream_merge__DOT__valid_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge->varInsert("DATA_WIDTH_IN", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__DATA_WIDTH_IN))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge->varInsert("NB_IN_STREAMS", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__NB_IN_STREAMS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge->varInsert("STRB_WIDTH_IN", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__STRB_WIDTH_IN))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge->varInsert("clear_i", &(TOP.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clear_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge->varInsert("clk_i", &(TOP.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clk_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge->varInsert("rst_ni", &(TOP.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__rst_ni), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge->varInsert("stream_valid", &(TOP.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__stream_valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,3,0);
+    __Vscopep_wrapper_hwpe_stream_merge__pop_o->varInsert("BYPASS_VCR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__pop_o.BYPASS_VCR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__pop_o->varInsert("BYPASS_VDR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__pop_o.BYPASS_VDR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__pop_o->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__pop_o.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__pop_o->varInsert("STRB_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__pop_o.STRB_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__pop_o->varInsert("clk", &(TOP__wrapper_hwpe_stream_merge__DOT__pop_o.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__pop_o->varInsert("data", &(TOP__wrapper_hwpe_stream_merge__DOT__pop_o.data), false, VLVT_UINT64, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,63,0);
+    __Vscopep_wrapper_hwpe_stream_merge__pop_o->varInsert("ready", &(TOP__wrapper_hwpe_stream_merge__DOT__pop_o.ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__pop_o->varInsert("strb", &(TOP__wrapper_hwpe_stream_merge__DOT__pop_o.strb), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_wrapper_hwpe_stream_merge__pop_o->varInsert("valid", &(TOP__wrapper_hwpe_stream_merge__DOT__pop_o.valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__->varInsert("BYPASS_VCR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.BYPASS_VCR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__->varInsert("BYPASS_VDR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.BYPASS_VDR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__->varInsert("STRB_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.STRB_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__->varInsert("clk", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__->varInsert("data", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.data), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__->varInsert("ready", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__->varInsert("strb", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.strb), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,1,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__->varInsert("valid", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__->varInsert("BYPASS_VCR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.BYPASS_VCR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__->varInsert("BYPASS_VDR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.BYPASS_VDR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__->varInsert("STRB_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.STRB_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__->varInsert("clk", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__->varInsert("data", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.data), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__->varInsert("ready", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__->varInsert("strb", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.strb), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,1,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__->varInsert("valid", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__->varInsert("BYPASS_VCR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.BYPASS_VCR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__->varInsert("BYPASS_VDR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.BYPASS_VDR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__->varInsert("STRB_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.STRB_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__->varInsert("clk", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__->varInsert("data", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.data), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__->varInsert("ready", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__->varInsert("strb", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.strb), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,1,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__->varInsert("valid", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__->varInsert("BYPASS_VCR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.BYPASS_VCR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__->varInsert("BYPASS_VDR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.BYPASS_VDR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__->varInsert("STRB_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.STRB_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__->varInsert("clk", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__->varInsert("data", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.data), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__->varInsert("ready", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__->varInsert("strb", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.strb), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,1,0);
+    __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__->varInsert("valid", &(TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+}
+
+Vtop__Syms::~Vtop__Syms() {
+    // Tear down scope hierarchy
+    __Vhier.remove(0, __Vscopep_hwpe_stream_package);
+    __Vhier.remove(0, __Vscopep_wrapper_hwpe_stream_merge);
+    __Vhier.remove(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge);
+    __Vhier.remove(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__pop_o);
+    __Vhier.remove(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__);
+    __Vhier.remove(__Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__);
+    // Clear keys from hierarchy map after values have been removed
+    __Vhier.clear();
+    // Tear down scopes
+    VL_DO_CLEAR(delete __Vscopep_hwpe_stream_package, __Vscopep_hwpe_stream_package = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge, __Vscopep_wrapper_hwpe_stream_merge__dut_hwpe_stream_merge = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_merge__pop_o, __Vscopep_wrapper_hwpe_stream_merge__pop_o = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__2__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__, __Vscopep_wrapper_hwpe_stream_merge__push_i__BRA__3__KET__ = nullptr);
+    // Tear down sub module instances
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.dtor();
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.dtor();
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.dtor();
+    TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.dtor();
+    TOP__wrapper_hwpe_stream_merge__DOT__pop_o.dtor();
+    TOP__hwpe_stream_package.dtor();
+}
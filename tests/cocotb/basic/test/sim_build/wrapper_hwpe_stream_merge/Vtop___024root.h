@@ -0,0 +1,73 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP___024ROOT_H_
+#define VERILATED_VTOP___024ROOT_H_  // guard
+
+#include "verilated.h"
+class Vtop_hwpe_stream_intf_stream__D10;
+class Vtop_hwpe_stream_intf_stream__D40;
+class Vtop_hwpe_stream_package;
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop___024root final {
+  public:
+    // CELLS
+    Vtop_hwpe_stream_package* __PVT__hwpe_stream_package;
+    Vtop_hwpe_stream_intf_stream__D10* __PVT__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__;
+    Vtop_hwpe_stream_intf_stream__D10* __PVT__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__;
+    Vtop_hwpe_stream_intf_stream__D10* __PVT__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__;
+    Vtop_hwpe_stream_intf_stream__D10* __PVT__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__;
+    Vtop_hwpe_stream_intf_stream__D40* __PVT__wrapper_hwpe_stream_merge__DOT__pop_o;
+
+    // DESIGN SPECIFIC STATE
+    CData/*0:0*/ wrapper_hwpe_stream_merge__DOT__clk_i;
+    CData/*0:0*/ wrapper_hwpe_stream_merge__DOT__rst_ni;
+    CData/*0:0*/ wrapper_hwpe_stream_merge__DOT__clear_i;
+    CData/*0:0*/ wrapper_hwpe_stream_merge__DOT__valid_o;
+    CData/*0:0*/ wrapper_hwpe_stream_merge__DOT__ready_o;
+    CData/*7:0*/ wrapper_hwpe_stream_merge__DOT__strb_o;
+    CData/*0:0*/ wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clk_i;
+    CData/*0:0*/ wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__rst_ni;
+    CData/*0:0*/ wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clear_i;
+    CData/*3:0*/ wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__stream_valid;
+    CData/*0:0*/ __VstlFirstIteration;
+    CData/*0:0*/ __VstlPhaseResult;
+    CData/*0:0*/ __VicoFirstIteration;
+    CData/*0:0*/ __VicoPhaseResult;
+    QData/*63:0*/ wrapper_hwpe_stream_merge__DOT__data_o;
+    VlUnpacked<CData/*0:0*/, 4> wrapper_hwpe_stream_merge__DOT__valid_i;
+    VlUnpacked<CData/*0:0*/, 4> wrapper_hwpe_stream_merge__DOT__ready_i;
+    VlUnpacked<SData/*15:0*/, 4> wrapper_hwpe_stream_merge__DOT__data_i;
+    VlUnpacked<CData/*1:0*/, 4> wrapper_hwpe_stream_merge__DOT__strb_i;
+    VlUnpacked<QData/*63:0*/, 1> __VstlTriggered;
+    VlUnpacked<QData/*63:0*/, 1> __VicoTriggered;
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_merge__DOT__DATA_WIDTH = 0x00000010U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_merge__DOT__NB_IN_STREAMS = 4U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_merge__DOT__STRB_WIDTH = 2U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_merge__DOT__DATA_WIDTH_O = 0x00000040U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_merge__DOT__STRB_WIDTH_O = 8U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__NB_IN_STREAMS = 4U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__DATA_WIDTH_IN = 0x00000010U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__STRB_WIDTH_IN = 2U;
+
+    // CONSTRUCTORS
+    Vtop___024root(Vtop__Syms* symsp, const char* namep);
+    ~Vtop___024root();
+    VL_UNCOPYABLE(Vtop___024root);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
@@ -0,0 +1,182 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop___024root___eval_triggers_vec__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VicoTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VicoTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VicoFirstIteration)));
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__ico\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ico_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clk_i 
+        = vlSelfRef.wrapper_hwpe_stream_merge__DOT__clk_i;
+    vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__rst_ni 
+        = vlSelfRef.wrapper_hwpe_stream_merge__DOT__rst_ni;
+    vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clear_i 
+        = vlSelfRef.wrapper_hwpe_stream_merge__DOT__clear_i;
+}
+
+void Vtop___024root___ico_sequent__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ico_sequent__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__stream_valid 
+        = ((((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.valid) 
+             << 3U) | ((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.valid) 
+                       << 2U)) | (((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.valid) 
+                                   << 1U) | (IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.valid)));
+    vlSelfRef.wrapper_hwpe_stream_merge__DOT__data_o 
+        = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o.data;
+    vlSelfRef.wrapper_hwpe_stream_merge__DOT__strb_o 
+        = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o.strb;
+}
+
+void Vtop___024root___ico_sequent__TOP__2(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ico_sequent__TOP__2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[3U] 
+        = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.ready;
+    vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[2U] 
+        = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.ready;
+    vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[1U] 
+        = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.ready;
+    vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[0U] 
+        = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.ready;
+    vlSelfRef.wrapper_hwpe_stream_merge__DOT__valid_o 
+        = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o.valid;
+}
+
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__0(Vtop_hwpe_stream_intf_stream__D40* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__1(Vtop_hwpe_stream_intf_stream__D40* vlSelf);
+
+void Vtop___024root___eval_ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VicoTriggered[0U])) {
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clk_i 
+            = vlSelfRef.wrapper_hwpe_stream_merge__DOT__clk_i;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__rst_ni 
+            = vlSelfRef.wrapper_hwpe_stream_merge__DOT__rst_ni;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clear_i 
+            = vlSelfRef.wrapper_hwpe_stream_merge__DOT__clear_i;
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____0((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET____0((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET____0((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET____0((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__));
+        Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__0((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o));
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__stream_valid 
+            = ((((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.valid) 
+                 << 3U) | ((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.valid) 
+                           << 2U)) | (((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.valid) 
+                                       << 1U) | (IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.valid)));
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__data_o 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o.data;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__strb_o 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o.strb;
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__));
+        Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__1((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o));
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[3U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.ready;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[2U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.ready;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[1U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.ready;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[0U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.ready;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__valid_o 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o.valid;
+    }
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VicoExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__ico(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+    }
+#endif
+    __VicoExecute = Vtop___024root___trigger_anySet__ico(vlSelfRef.__VicoTriggered);
+    if (__VicoExecute) {
+        Vtop___024root___eval_ico(vlSelf);
+    }
+    return (__VicoExecute);
+}
+
+void Vtop___024root___eval(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VicoIterCount;
+    // Body
+    __VicoIterCount = 0U;
+    vlSelfRef.__VicoFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VicoIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+#endif
+            VL_FATAL_MT("/root/package/tests/cocotb/basic/wrappers/wrapper_hwpe_stream_merge.sv", 8, "", "DIDNOTCONVERGE: Input combinational region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VicoIterCount = ((IData)(1U) + __VicoIterCount);
+        vlSelfRef.__VicoPhaseResult = Vtop___024root___eval_phase__ico(vlSelf);
+        vlSelfRef.__VicoFirstIteration = 0U;
+    } while (vlSelfRef.__VicoPhaseResult);
+}
+
+#ifdef VL_DEBUG
+void Vtop___024root___eval_debug_assertions(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_debug_assertions\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+#endif  // VL_DEBUG
@@ -0,0 +1,214 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop___024root___eval_static(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_final(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_final\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_settle(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_settle\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VstlIterCount;
+    // Body
+    __VstlIterCount = 0U;
+    vlSelfRef.__VstlFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VstlIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+#endif
+            VL_FATAL_MT("/root/package/tests/cocotb/basic/wrappers/wrapper_hwpe_stream_merge.sv", 8, "", "DIDNOTCONVERGE: Settle region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VstlIterCount = ((IData)(1U) + __VstlIterCount);
+        vlSelfRef.__VstlPhaseResult = Vtop___024root___eval_phase__stl(vlSelf);
+        vlSelfRef.__VstlFirstIteration = 0U;
+    } while (vlSelfRef.__VstlPhaseResult);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_triggers_vec__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VstlTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VstlTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VstlFirstIteration)));
+}
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__stl\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__stl(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'stl' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__stl\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__0(Vtop_hwpe_stream_intf_stream__D40* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__1(Vtop_hwpe_stream_intf_stream__D40* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VstlTriggered[0U])) {
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clk_i 
+            = vlSelfRef.wrapper_hwpe_stream_merge__DOT__clk_i;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__rst_ni 
+            = vlSelfRef.wrapper_hwpe_stream_merge__DOT__rst_ni;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clear_i 
+            = vlSelfRef.wrapper_hwpe_stream_merge__DOT__clear_i;
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____0((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET____0((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET____0((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET____0((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__));
+        Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__0((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o));
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__stream_valid 
+            = ((((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.valid) 
+                 << 3U) | ((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.valid) 
+                           << 2U)) | (((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.valid) 
+                                       << 1U) | (IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.valid)));
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__data_o 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o.data;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__strb_o 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o.strb;
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__));
+        Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__1((&vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o));
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[3U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.ready;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[2U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.ready;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[1U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.ready;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__ready_i[0U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.ready;
+        vlSelfRef.wrapper_hwpe_stream_merge__DOT__valid_o 
+            = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o.valid;
+    }
+}
+
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VstlExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__stl(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+    }
+#endif
+    __VstlExecute = Vtop___024root___trigger_anySet__stl(vlSelfRef.__VstlTriggered);
+    if (__VstlExecute) {
+        Vtop___024root___eval_stl(vlSelf);
+    }
+    return (__VstlExecute);
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__ico\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__ico(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'ico' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->wrapper_hwpe_stream_merge__DOT__clk_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16238857035050088668ull);
+    vlSelf->wrapper_hwpe_stream_merge__DOT__rst_ni = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17018390261965584687ull);
+    vlSelf->wrapper_hwpe_stream_merge__DOT__clear_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17009607895144648191ull);
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->wrapper_hwpe_stream_merge__DOT__valid_i[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7768796066082164840ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->wrapper_hwpe_stream_merge__DOT__ready_i[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15299582498996172695ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->wrapper_hwpe_stream_merge__DOT__data_i[__Vi0] = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 7602347429152629007ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 4; ++__Vi0) {
+        vlSelf->wrapper_hwpe_stream_merge__DOT__strb_i[__Vi0] = VL_SCOPED_RAND_RESET_I(2, __VscopeHash, 1037914246968745536ull);
+    }
+    vlSelf->wrapper_hwpe_stream_merge__DOT__valid_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7293439338271497824ull);
+    vlSelf->wrapper_hwpe_stream_merge__DOT__ready_o = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11165364863599791593ull);
+    vlSelf->wrapper_hwpe_stream_merge__DOT__data_o = VL_SCOPED_RAND_RESET_Q(64, __VscopeHash, 14497242763498459905ull);
+    vlSelf->wrapper_hwpe_stream_merge__DOT__strb_o = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 11369731551248175300ull);
+    vlSelf->wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clk_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2614814946444684366ull);
+    vlSelf->wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__rst_ni = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17312787495975776800ull);
+    vlSelf->wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__clear_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8143864725161872270ull);
+    vlSelf->wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__stream_valid = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 15097088894940266589ull);
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VstlTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VicoTriggered[__Vi0] = 0;
+    }
+}
@@ -0,0 +1,57 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__clk_i;
+    vlSelfRef.data = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__data_i[3U];
+    vlSelfRef.strb = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__strb_i[3U];
+    vlSelfRef.valid = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__valid_i[3U];
+}
+
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1(Vtop_hwpe_stream_intf_stream__D10* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET____1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.ready = vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__pop_o.ready;
+}
+
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__clk_i;
+    vlSelfRef.data = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__data_i[2U];
+    vlSelfRef.strb = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__strb_i[2U];
+    vlSelfRef.valid = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__valid_i[2U];
+}
+
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__clk_i;
+    vlSelfRef.data = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__data_i[1U];
+    vlSelfRef.strb = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__strb_i[1U];
+    vlSelfRef.valid = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__valid_i[1U];
+}
+
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__clk_i;
+    vlSelfRef.data = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__data_i[0U];
+    vlSelfRef.strb = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__strb_i[0U];
+    vlSelfRef.valid = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__valid_i[0U];
+}
@@ -0,0 +1,45 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP_HWPE_STREAM_INTF_STREAM__D40_H_
+#define VERILATED_VTOP_HWPE_STREAM_INTF_STREAM__D40_H_  // guard
+
+#include "verilated.h"
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop_hwpe_stream_intf_stream__D40 final {
+  public:
+
+    // DESIGN SPECIFIC STATE
+    CData/*0:0*/ clk;
+    CData/*0:0*/ valid;
+    CData/*0:0*/ ready;
+    CData/*7:0*/ strb;
+    QData/*63:0*/ data;
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr CData/*0:0*/ BYPASS_VCR_ASSERT = 0U;
+    static constexpr CData/*0:0*/ BYPASS_VDR_ASSERT = 0U;
+    static constexpr IData/*31:0*/ DATA_WIDTH = 0x00000040U;
+    static constexpr IData/*31:0*/ STRB_WIDTH = 8U;
+
+    // CONSTRUCTORS
+    Vtop_hwpe_stream_intf_stream__D40();
+    ~Vtop_hwpe_stream_intf_stream__D40();
+    void ctor(Vtop__Syms* symsp, const char* namep);
+    void dtor();
+    VL_UNCOPYABLE(Vtop_hwpe_stream_intf_stream__D40);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
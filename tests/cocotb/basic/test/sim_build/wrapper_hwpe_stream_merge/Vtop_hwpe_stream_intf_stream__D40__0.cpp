@@ -0,0 +1,34 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__0(Vtop_hwpe_stream_intf_stream__D40* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__clk_i;
+    vlSelfRef.ready = vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__ready_o;
+    vlSelfRef.data = (((QData)((IData)((((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.data) 
+                                         << 0x00000010U) 
+                                        | (IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.data)))) 
+                       << 0x00000020U) | (QData)((IData)(
+                                                         (((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.data) 
+                                                           << 0x00000010U) 
+                                                          | (IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.data)))));
+    vlSelfRef.strb = ((((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__3__KET__.strb) 
+                        << 6U) | ((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__2__KET__.strb) 
+                                  << 4U)) | (((IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__1__KET__.strb) 
+                                              << 2U) 
+                                             | (IData)(vlSymsp->TOP__wrapper_hwpe_stream_merge__DOT__push_i__BRA__0__KET__.strb)));
+}
+
+void Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__1(Vtop_hwpe_stream_intf_stream__D40* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream__D40___ico_sequent__TOP__wrapper_hwpe_stream_merge__DOT__pop_o__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.valid = (0x0000000fU == (IData)(vlSymsp->TOP.wrapper_hwpe_stream_merge__DOT__dut_hwpe_stream_merge__DOT__stream_valid));
+}
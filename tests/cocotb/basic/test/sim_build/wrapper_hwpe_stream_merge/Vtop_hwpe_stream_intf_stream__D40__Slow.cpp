@@ -0,0 +1,32 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+// Parameter definitions for Vtop_hwpe_stream_intf_stream__D40
+constexpr CData/*0:0*/ Vtop_hwpe_stream_intf_stream__D40::BYPASS_VCR_ASSERT;
+constexpr CData/*0:0*/ Vtop_hwpe_stream_intf_stream__D40::BYPASS_VDR_ASSERT;
+constexpr IData/*31:0*/ Vtop_hwpe_stream_intf_stream__D40::DATA_WIDTH;
+constexpr IData/*31:0*/ Vtop_hwpe_stream_intf_stream__D40::STRB_WIDTH;
+
+
+void Vtop_hwpe_stream_intf_stream__D40___ctor_var_reset(Vtop_hwpe_stream_intf_stream__D40* vlSelf);
+
+Vtop_hwpe_stream_intf_stream__D40::Vtop_hwpe_stream_intf_stream__D40() = default;
+Vtop_hwpe_stream_intf_stream__D40::~Vtop_hwpe_stream_intf_stream__D40() = default;
+
+void Vtop_hwpe_stream_intf_stream__D40::ctor(Vtop__Syms* symsp, const char* namep) {
+    vlSymsp = symsp;
+    vlNamep = strdup(Verilated::catName(vlSymsp->name(), namep));
+    // Reset structure values
+    Vtop_hwpe_stream_intf_stream__D40___ctor_var_reset(this);
+}
+
+void Vtop_hwpe_stream_intf_stream__D40::__Vconfigure(bool first) {
+    (void)first;  // Prevent unused variable warning
+}
+
+void Vtop_hwpe_stream_intf_stream__D40::dtor() {
+    VL_DO_DANGLING(std::free(const_cast<char*>(vlNamep)), vlNamep);
+}
@@ -0,0 +1,29 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+// Parameter definitions for Vtop_hwpe_stream_package
+constexpr IData/*31:0*/ Vtop_hwpe_stream_package::HWPE_STREAM_REALIGN_SOURCE;
+constexpr IData/*31:0*/ Vtop_hwpe_stream_package::HWPE_STREAM_REALIGN_SINK;
+constexpr IData/*31:0*/ Vtop_hwpe_stream_package::NB_SERDES_STREAMS_MAX;
+
+
+
+Vtop_hwpe_stream_package::Vtop_hwpe_stream_package() = default;
+Vtop_hwpe_stream_package::~Vtop_hwpe_stream_package() = default;
+
+void Vtop_hwpe_stream_package::ctor(Vtop__Syms* symsp, const char* namep) {
+    vlSymsp = symsp;
+    vlNamep = strdup(Verilated::catName(vlSymsp->name(), namep));
+    // Reset structure values
+}
+
+void Vtop_hwpe_stream_package::__Vconfigure(bool first) {
+    (void)first;  // Prevent unused variable warning
+}
+
+void Vtop_hwpe_stream_package::dtor() {
+    VL_DO_DANGLING(std::free(const_cast<char*>(vlNamep)), vlNamep);
+}
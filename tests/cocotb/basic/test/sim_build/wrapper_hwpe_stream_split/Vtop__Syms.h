@@ -0,0 +1,59 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table internal header
+//
+// Internal details; most calling programs do not need this header,
+// unless using verilator public meta comments.
+
+#ifndef VERILATED_VTOP__SYMS_H_
+#define VERILATED_VTOP__SYMS_H_  // guard
+
+#include "verilated.h"
+
+// INCLUDE MODEL CLASS
+
+#include "Vtop.h"
+
+// INCLUDE MODULE CLASSES
+#include "Vtop___024root.h"
+#include "Vtop___024unit.h"
+#include "Vtop_hwpe_stream_package.h"
+#include "Vtop_hwpe_stream_intf_stream.h"
+#include "Vtop_hwpe_stream_intf_stream__D10.h"
+
+// DPI TYPES for DPI Export callbacks (Internal use)
+
+// SYMS CLASS (contains all model state)
+class alignas(VL_CACHE_LINE_BYTES) Vtop__Syms final : public VerilatedSyms {
+  public:
+    // INTERNAL STATE
+    Vtop* const __Vm_modelp;
+    VlDeleter __Vm_deleter;
+    bool __Vm_didInit = false;
+
+    // MODULE INSTANCE STATE
+    Vtop___024root                 TOP;
+    Vtop_hwpe_stream_package       TOP__hwpe_stream_package;
+    Vtop_hwpe_stream_intf_stream__D10 TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__;
+    Vtop_hwpe_stream_intf_stream__D10 TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__;
+    Vtop_hwpe_stream_intf_stream   TOP__wrapper_hwpe_stream_split__DOT__push_i;
+
+    // SCOPE NAMES
+    VerilatedScope* __Vscopep_hwpe_stream_package;
+    VerilatedScope* __Vscopep_wrapper_hwpe_stream_split;
+    VerilatedScope* __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split;
+    VerilatedScope* __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__;
+    VerilatedScope* __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__;
+    VerilatedScope* __Vscopep_wrapper_hwpe_stream_split__push_i;
+
+    // SCOPE HIERARCHY
+    VerilatedHierarchy __Vhier;
+
+    // CONSTRUCTORS
+    Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp);
+    ~Vtop__Syms();
+
+    // METHODS
+    const char* name() const { return TOP.vlNamep; }
+};
+
+#endif  // guard
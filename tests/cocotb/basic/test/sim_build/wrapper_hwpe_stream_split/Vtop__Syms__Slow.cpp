@@ -0,0 +1,129 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+Vtop__Syms::Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp)
+    : VerilatedSyms{contextp}
+    // Setup internal state of the Syms class
+    , __Vm_modelp{modelp}
+    // Setup top module instance
+    , TOP{this, namep}
+{
+    // Check resources
+    Verilated::stackCheck(124);
+    // Setup sub module instances
+    TOP__hwpe_stream_package.ctor(this, "hwpe_stream_package");
+    TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.ctor(this, "wrapper_hwpe_stream_split.pop_o[0]");
+    TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.ctor(this, "wrapper_hwpe_stream_split.pop_o[1]");
+    TOP__wrapper_hwpe_stream_split__DOT__push_i.ctor(this, "wrapper_hwpe_stream_split.push_i");
+    // Configure time unit / time precision
+    _vm_contextp__->timeunit(-12);
+    _vm_contextp__->timeprecision(-12);
+    // Setup each module's pointers to their submodules
+    TOP.__PVT__hwpe_stream_package = &TOP__hwpe_stream_package;
+    TOP.__PVT__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__ = &TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__;
+    TOP.__PVT__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__ = &TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__;
+    TOP.__PVT__wrapper_hwpe_stream_split__DOT__push_i = &TOP__wrapper_hwpe_stream_split__DOT__push_i;
+    // Setup each module's pointer back to symbol table (for public functions)
+    TOP.__Vconfigure(true);
+    TOP__hwpe_stream_package.__Vconfigure(true);
+    TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.__Vconfigure(true);
+    TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.__Vconfigure(false);
+    TOP__wrapper_hwpe_stream_split__DOT__push_i.__Vconfigure(true);
+    // Setup scopes
+    __Vscopep_hwpe_stream_package = new VerilatedScope{this, "hwpe_stream_package", "hwpe_stream_package", "hwpe_stream_package", -12, VerilatedScope::SCOPE_PACKAGE};
+    __Vscopep_wrapper_hwpe_stream_split = new VerilatedScope{this, "wrapper_hwpe_stream_split", "wrapper_hwpe_stream_split", "wrapper_hwpe_stream_split", -12, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split = new VerilatedScope{this, "wrapper_hwpe_stream_split.dut_hwpe_stream_split", "dut_hwpe_stream_split", "hwpe_stream_split", -12, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__ = new VerilatedScope{this, "wrapper_hwpe_stream_split.pop_o[0]", "pop_o[0]", "hwpe_stream_intf_stream", -12, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__ = new VerilatedScope{this, "wrapper_hwpe_stream_split.pop_o[1]", "pop_o[1]", "hwpe_stream_intf_stream", -12, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_wrapper_hwpe_stream_split__push_i = new VerilatedScope{this, "wrapper_hwpe_stream_split.push_i", "push_i", "hwpe_stream_intf_stream", -12, VerilatedScope::SCOPE_MODULE};
+    // Set up scope hierarchy
+    __Vhier.add(0, __Vscopep_hwpe_stream_package);
+    __Vhier.add(0, __Vscopep_wrapper_hwpe_stream_split);
+    __Vhier.add(__Vscopep_wrapper_hwpe_stream_split, __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split);
+    __Vhier.add(__Vscopep_wrapper_hwpe_stream_split, __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__);
+    __Vhier.add(__Vscopep_wrapper_hwpe_stream_split, __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__);
+    __Vhier.add(__Vscopep_wrapper_hwpe_stream_split, __Vscopep_wrapper_hwpe_stream_split__push_i);
+    // Setup export functions - final: 0
+    // Setup export functions - final: 1
+    // Setup public variables
+    __Vscopep_hwpe_stream_package->varInsert("HWPE_STREAM_REALIGN_SINK", const_cast<void*>(static_cast<const void*>(&(TOP__hwpe_stream_package.HWPE_STREAM_REALIGN_SINK))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_hwpe_stream_package->varInsert("HWPE_STREAM_REALIGN_SOURCE", const_cast<void*>(static_cast<const void*>(&(TOP__hwpe_stream_package.HWPE_STREAM_REALIGN_SOURCE))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_hwpe_stream_package->varInsert("NB_SERDES_STREAMS_MAX", const_cast<void*>(static_cast<const void*>(&(TOP__hwpe_stream_package.NB_SERDES_STREAMS_MAX))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("DATA_WIDTH_IN", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_split__DOT__DATA_WIDTH_IN))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("DATA_WIDTH_OUT", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_split__DOT__DATA_WIDTH_OUT))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("NB_OUT_STREAMS", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_split__DOT__NB_OUT_STREAMS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("STRB_WIDTH_IN", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_split__DOT__STRB_WIDTH_IN))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("STRB_WIDTH_OUT", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_split__DOT__STRB_WIDTH_OUT))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("clear_i", &(TOP.wrapper_hwpe_stream_split__DOT__clear_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("clk_i", &(TOP.wrapper_hwpe_stream_split__DOT__clk_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("data_i", &(TOP.wrapper_hwpe_stream_split__DOT__data_i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("data_o", &(TOP.wrapper_hwpe_stream_split__DOT__data_o), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 1, 1 ,1,0 ,15,0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("ready_i", &(TOP.wrapper_hwpe_stream_split__DOT__ready_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("ready_o", &(TOP.wrapper_hwpe_stream_split__DOT__ready_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,1,0 ,0,0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("rst_ni", &(TOP.wrapper_hwpe_stream_split__DOT__rst_ni), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("strb_i", &(TOP.wrapper_hwpe_stream_split__DOT__strb_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("strb_o", &(TOP.wrapper_hwpe_stream_split__DOT__strb_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 1, 1 ,1,0 ,1,0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("valid_i", &(TOP.wrapper_hwpe_stream_split__DOT__valid_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split->varInsert("valid_o", &(TOP.wrapper_hwpe_stream_split__DOT__valid_o), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 1, 1 ,1,0 ,0,0);
+    __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split->varInsert("DATA_WIDTH_IN", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__DATA_WIDTH_IN))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split->varInsert("DATA_WIDTH_OUT", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__DATA_WIDTH_OUT))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split->varInsert("NB_OUT_STREAMS", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__NB_OUT_STREAMS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split->varInsert("STRB_WIDTH_OUT", const_cast<void*>(static_cast<const void*>(&(TOP.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__STRB_WIDTH_OUT))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split->varInsert("clear_i", &(TOP.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__clear_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split->varInsert("clk_i", &(TOP.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__clk_i), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split->varInsert("rst_ni", &(TOP.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__rst_ni), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split->varInsert("stream_ready", &(TOP.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__stream_ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,1,0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__->varInsert("BYPASS_VCR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.BYPASS_VCR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__->varInsert("BYPASS_VDR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.BYPASS_VDR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__->varInsert("STRB_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.STRB_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__->varInsert("clk", &(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__->varInsert("data", &(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.data), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__->varInsert("ready", &(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__->varInsert("strb", &(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.strb), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,1,0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__->varInsert("valid", &(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__->varInsert("BYPASS_VCR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.BYPASS_VCR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__->varInsert("BYPASS_VDR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.BYPASS_VDR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__->varInsert("STRB_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.STRB_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__->varInsert("clk", &(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__->varInsert("data", &(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.data), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__->varInsert("ready", &(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__->varInsert("strb", &(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.strb), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,1,0);
+    __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__->varInsert("valid", &(TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__push_i->varInsert("BYPASS_VCR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__push_i.BYPASS_VCR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__push_i->varInsert("BYPASS_VDR_ASSERT", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__push_i.BYPASS_VDR_ASSERT))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_BITVAR, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__push_i->varInsert("DATA_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__push_i.DATA_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split__push_i->varInsert("STRB_WIDTH", const_cast<void*>(static_cast<const void*>(&(TOP__wrapper_hwpe_stream_split__DOT__push_i.STRB_WIDTH))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split__push_i->varInsert("clk", &(TOP__wrapper_hwpe_stream_split__DOT__push_i.clk), false, VLVT_UINT8, VLVD_IN|VLVF_PUB_RW, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__push_i->varInsert("data", &(TOP__wrapper_hwpe_stream_split__DOT__push_i.data), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,31,0);
+    __Vscopep_wrapper_hwpe_stream_split__push_i->varInsert("ready", &(TOP__wrapper_hwpe_stream_split__DOT__push_i.ready), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_wrapper_hwpe_stream_split__push_i->varInsert("strb", &(TOP__wrapper_hwpe_stream_split__DOT__push_i.strb), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,3,0);
+    __Vscopep_wrapper_hwpe_stream_split__push_i->varInsert("valid", &(TOP__wrapper_hwpe_stream_split__DOT__push_i.valid), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+}
+
+Vtop__Syms::~Vtop__Syms() {
+    // Tear down scope hierarchy
+    __Vhier.remove(0, __Vscopep_hwpe_stream_package);
+    __Vhier.remove(0, __Vscopep_wrapper_hwpe_stream_split);
+    __Vhier.remove(__Vscopep_wrapper_hwpe_stream_split, __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split);
+    __Vhier.remove(__Vscopep_wrapper_hwpe_stream_split, __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__);
+    __Vhier.remove(__Vscopep_wrapper_hwpe_stream_split, __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__);
+    __Vhier.remove(__Vscopep_wrapper_hwpe_stream_split, __Vscopep_wrapper_hwpe_stream_split__push_i);
+    // Clear keys from hierarchy map after values have been removed
+    __Vhier.clear();
+    // Tear down scopes
+    VL_DO_CLEAR(delete __Vscopep_hwpe_stream_package, __Vscopep_hwpe_stream_package = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_split, __Vscopep_wrapper_hwpe_stream_split = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split, __Vscopep_wrapper_hwpe_stream_split__dut_hwpe_stream_split = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__, __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__0__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__, __Vscopep_wrapper_hwpe_stream_split__pop_o__BRA__1__KET__ = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_wrapper_hwpe_stream_split__push_i, __Vscopep_wrapper_hwpe_stream_split__push_i = nullptr);
+    // Tear down sub module instances
+    TOP__wrapper_hwpe_stream_split__DOT__push_i.dtor();
+    TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.dtor();
+    TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.dtor();
+    TOP__hwpe_stream_package.dtor();
+}
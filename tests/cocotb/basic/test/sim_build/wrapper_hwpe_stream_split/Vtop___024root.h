@@ -0,0 +1,72 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP___024ROOT_H_
+#define VERILATED_VTOP___024ROOT_H_  // guard
+
+#include "verilated.h"
+class Vtop_hwpe_stream_intf_stream;
+class Vtop_hwpe_stream_intf_stream__D10;
+class Vtop_hwpe_stream_package;
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop___024root final {
+  public:
+    // CELLS
+    Vtop_hwpe_stream_package* __PVT__hwpe_stream_package;
+    Vtop_hwpe_stream_intf_stream* __PVT__wrapper_hwpe_stream_split__DOT__push_i;
+    Vtop_hwpe_stream_intf_stream__D10* __PVT__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__;
+    Vtop_hwpe_stream_intf_stream__D10* __PVT__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__;
+
+    // DESIGN SPECIFIC STATE
+    CData/*0:0*/ wrapper_hwpe_stream_split__DOT__clk_i;
+    CData/*0:0*/ wrapper_hwpe_stream_split__DOT__rst_ni;
+    CData/*0:0*/ wrapper_hwpe_stream_split__DOT__clear_i;
+    CData/*0:0*/ wrapper_hwpe_stream_split__DOT__valid_i;
+    CData/*0:0*/ wrapper_hwpe_stream_split__DOT__ready_i;
+    CData/*3:0*/ wrapper_hwpe_stream_split__DOT__strb_i;
+    CData/*0:0*/ wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__clk_i;
+    CData/*0:0*/ wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__rst_ni;
+    CData/*0:0*/ wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__clear_i;
+    CData/*1:0*/ wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__stream_ready;
+    CData/*0:0*/ __VstlFirstIteration;
+    CData/*0:0*/ __VstlPhaseResult;
+    CData/*0:0*/ __VicoFirstIteration;
+    CData/*0:0*/ __VicoPhaseResult;
+    IData/*31:0*/ wrapper_hwpe_stream_split__DOT__data_i;
+    VlUnpacked<CData/*0:0*/, 2> wrapper_hwpe_stream_split__DOT__valid_o;
+    VlUnpacked<CData/*0:0*/, 2> wrapper_hwpe_stream_split__DOT__ready_o;
+    VlUnpacked<SData/*15:0*/, 2> wrapper_hwpe_stream_split__DOT__data_o;
+    VlUnpacked<CData/*1:0*/, 2> wrapper_hwpe_stream_split__DOT__strb_o;
+    VlUnpacked<QData/*63:0*/, 1> __VstlTriggered;
+    VlUnpacked<QData/*63:0*/, 1> __VicoTriggered;
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_split__DOT__DATA_WIDTH_IN = 0x00000020U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_split__DOT__NB_OUT_STREAMS = 2U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_split__DOT__STRB_WIDTH_IN = 4U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_split__DOT__DATA_WIDTH_OUT = 0x00000010U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_split__DOT__STRB_WIDTH_OUT = 2U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__NB_OUT_STREAMS = 2U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__DATA_WIDTH_IN = 0x00000020U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__DATA_WIDTH_OUT = 0x00000010U;
+    static constexpr IData/*31:0*/ wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__STRB_WIDTH_OUT = 2U;
+
+    // CONSTRUCTORS
+    Vtop___024root(Vtop__Syms* symsp, const char* namep);
+    ~Vtop___024root();
+    VL_UNCOPYABLE(Vtop___024root);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
@@ -0,0 +1,203 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop___024root___eval_static(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_final(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_final\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_settle(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_settle\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VstlIterCount;
+    // Body
+    __VstlIterCount = 0U;
+    vlSelfRef.__VstlFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VstlIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+#endif
+            VL_FATAL_MT("/root/package/tests/cocotb/basic/wrappers/wrapper_hwpe_stream_split.sv", 8, "", "DIDNOTCONVERGE: Settle region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VstlIterCount = ((IData)(1U) + __VstlIterCount);
+        vlSelfRef.__VstlPhaseResult = Vtop___024root___eval_phase__stl(vlSelf);
+        vlSelfRef.__VstlFirstIteration = 0U;
+    } while (vlSelfRef.__VstlPhaseResult);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_triggers_vec__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VstlTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VstlTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VstlFirstIteration)));
+}
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__stl\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__stl(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'stl' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__stl\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop_hwpe_stream_intf_stream___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__push_i__0(Vtop_hwpe_stream_intf_stream* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf);
+void Vtop_hwpe_stream_intf_stream___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__push_i__1(Vtop_hwpe_stream_intf_stream* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VstlTriggered[0U])) {
+        vlSelfRef.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__clk_i 
+            = vlSelfRef.wrapper_hwpe_stream_split__DOT__clk_i;
+        vlSelfRef.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__rst_ni 
+            = vlSelfRef.wrapper_hwpe_stream_split__DOT__rst_ni;
+        vlSelfRef.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__clear_i 
+            = vlSelfRef.wrapper_hwpe_stream_split__DOT__clear_i;
+        Vtop_hwpe_stream_intf_stream___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__push_i__0((&vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__push_i));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET____0((&vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__));
+        Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET____0((&vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__));
+        vlSelfRef.wrapper_hwpe_stream_split__DOT__valid_o[1U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.valid;
+        vlSelfRef.wrapper_hwpe_stream_split__DOT__data_o[1U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.data;
+        vlSelfRef.wrapper_hwpe_stream_split__DOT__strb_o[1U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.strb;
+        vlSelfRef.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__stream_ready 
+            = (((IData)(vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET__.ready) 
+                << 1U) | (IData)(vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.ready));
+        vlSelfRef.wrapper_hwpe_stream_split__DOT__valid_o[0U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.valid;
+        vlSelfRef.wrapper_hwpe_stream_split__DOT__data_o[0U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.data;
+        vlSelfRef.wrapper_hwpe_stream_split__DOT__strb_o[0U] 
+            = vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET__.strb;
+        Vtop_hwpe_stream_intf_stream___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__push_i__1((&vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__push_i));
+        vlSelfRef.wrapper_hwpe_stream_split__DOT__ready_i 
+            = vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__push_i.ready;
+    }
+}
+
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VstlExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__stl(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+    }
+#endif
+    __VstlExecute = Vtop___024root___trigger_anySet__stl(vlSelfRef.__VstlTriggered);
+    if (__VstlExecute) {
+        Vtop___024root___eval_stl(vlSelf);
+    }
+    return (__VstlExecute);
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__ico\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__ico(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'ico' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->wrapper_hwpe_stream_split__DOT__clk_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5762950497831997337ull);
+    vlSelf->wrapper_hwpe_stream_split__DOT__rst_ni = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16959656222914354283ull);
+    vlSelf->wrapper_hwpe_stream_split__DOT__clear_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13539231570381518145ull);
+    vlSelf->wrapper_hwpe_stream_split__DOT__valid_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17178235384344379790ull);
+    vlSelf->wrapper_hwpe_stream_split__DOT__ready_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16337134208197289821ull);
+    vlSelf->wrapper_hwpe_stream_split__DOT__data_i = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10115421801844466210ull);
+    vlSelf->wrapper_hwpe_stream_split__DOT__strb_i = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 3545166910536667922ull);
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->wrapper_hwpe_stream_split__DOT__valid_o[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2395384161046539455ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->wrapper_hwpe_stream_split__DOT__ready_o[__Vi0] = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10777036877259612686ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->wrapper_hwpe_stream_split__DOT__data_o[__Vi0] = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 12325418414154578307ull);
+    }
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->wrapper_hwpe_stream_split__DOT__strb_o[__Vi0] = VL_SCOPED_RAND_RESET_I(2, __VscopeHash, 1473138866871776729ull);
+    }
+    vlSelf->wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__clk_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15732545266672476954ull);
+    vlSelf->wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__rst_ni = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9006061997768683127ull);
+    vlSelf->wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__clear_i = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4810740096310175965ull);
+    vlSelf->wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__stream_ready = VL_SCOPED_RAND_RESET_I(2, __VscopeHash, 17326286161500786378ull);
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VstlTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VicoTriggered[__Vi0] = 0;
+    }
+}
@@ -0,0 +1,35 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+// Parameter definitions for Vtop___024root
+constexpr IData/*31:0*/ Vtop___024root::wrapper_hwpe_stream_split__DOT__DATA_WIDTH_IN;
+constexpr IData/*31:0*/ Vtop___024root::wrapper_hwpe_stream_split__DOT__NB_OUT_STREAMS;
+constexpr IData/*31:0*/ Vtop___024root::wrapper_hwpe_stream_split__DOT__STRB_WIDTH_IN;
+constexpr IData/*31:0*/ Vtop___024root::wrapper_hwpe_stream_split__DOT__DATA_WIDTH_OUT;
+constexpr IData/*31:0*/ Vtop___024root::wrapper_hwpe_stream_split__DOT__STRB_WIDTH_OUT;
+constexpr IData/*31:0*/ Vtop___024root::wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__NB_OUT_STREAMS;
+constexpr IData/*31:0*/ Vtop___024root::wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__DATA_WIDTH_IN;
+constexpr IData/*31:0*/ Vtop___024root::wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__DATA_WIDTH_OUT;
+constexpr IData/*31:0*/ Vtop___024root::wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__STRB_WIDTH_OUT;
+
+
+void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf);
+
+Vtop___024root::Vtop___024root(Vtop__Syms* symsp, const char* namep)
+ {
+    vlSymsp = symsp;
+    vlNamep = strdup(namep);
+    // Reset structure values
+    Vtop___024root___ctor_var_reset(this);
+}
+
+void Vtop___024root::__Vconfigure(bool first) {
+    (void)first;  // Prevent unused variable warning
+}
+
+Vtop___024root::~Vtop___024root() {
+    VL_DO_DANGLING(std::free(const_cast<char*>(vlNamep)), vlNamep);
+}
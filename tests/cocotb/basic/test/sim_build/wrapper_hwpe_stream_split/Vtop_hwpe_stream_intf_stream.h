@@ -0,0 +1,45 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP_HWPE_STREAM_INTF_STREAM_H_
+#define VERILATED_VTOP_HWPE_STREAM_INTF_STREAM_H_  // guard
+
+#include "verilated.h"
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop_hwpe_stream_intf_stream final {
+  public:
+
+    // DESIGN SPECIFIC STATE
+    CData/*0:0*/ clk;
+    CData/*0:0*/ valid;
+    CData/*0:0*/ ready;
+    CData/*3:0*/ strb;
+    IData/*31:0*/ data;
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr CData/*0:0*/ BYPASS_VCR_ASSERT = 0U;
+    static constexpr CData/*0:0*/ BYPASS_VDR_ASSERT = 0U;
+    static constexpr IData/*31:0*/ DATA_WIDTH = 0x00000020U;
+    static constexpr IData/*31:0*/ STRB_WIDTH = 4U;
+
+    // CONSTRUCTORS
+    Vtop_hwpe_stream_intf_stream();
+    ~Vtop_hwpe_stream_intf_stream();
+    void ctor(Vtop__Syms* symsp, const char* namep);
+    void dtor();
+    VL_UNCOPYABLE(Vtop_hwpe_stream_intf_stream);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
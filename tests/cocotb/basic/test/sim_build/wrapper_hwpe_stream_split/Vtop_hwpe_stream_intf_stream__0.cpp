@@ -0,0 +1,24 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop_hwpe_stream_intf_stream___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__push_i__0(Vtop_hwpe_stream_intf_stream* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__push_i__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.wrapper_hwpe_stream_split__DOT__clk_i;
+    vlSelfRef.valid = vlSymsp->TOP.wrapper_hwpe_stream_split__DOT__valid_i;
+    vlSelfRef.data = vlSymsp->TOP.wrapper_hwpe_stream_split__DOT__data_i;
+    vlSelfRef.strb = vlSymsp->TOP.wrapper_hwpe_stream_split__DOT__strb_i;
+}
+
+void Vtop_hwpe_stream_intf_stream___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__push_i__1(Vtop_hwpe_stream_intf_stream* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__push_i__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.ready = (3U == (IData)(vlSymsp->TOP.wrapper_hwpe_stream_split__DOT__dut_hwpe_stream_split__DOT__stream_ready));
+}
@@ -0,0 +1,18 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VL_ATTR_COLD void Vtop_hwpe_stream_intf_stream___ctor_var_reset(Vtop_hwpe_stream_intf_stream* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16707436170211756652ull);
+    vlSelf->valid = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4944192500720994163ull);
+    vlSelf->ready = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 898948264233693212ull);
+    vlSelf->data = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 10363016170300574568ull);
+    vlSelf->strb = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 11037580064018405771ull);
+}
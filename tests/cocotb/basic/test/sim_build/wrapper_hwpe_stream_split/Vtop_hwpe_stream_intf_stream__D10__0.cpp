@@ -0,0 +1,31 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__1__KET____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.wrapper_hwpe_stream_split__DOT__clk_i;
+    vlSelfRef.ready = vlSymsp->TOP.wrapper_hwpe_stream_split__DOT__ready_o[1U];
+    vlSelfRef.valid = vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__push_i.valid;
+    vlSelfRef.data = (vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__push_i.data 
+                      >> 0x00000010U);
+    vlSelfRef.strb = (3U & ((IData)(vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__push_i.strb) 
+                            >> 2U));
+}
+
+void Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET____0(Vtop_hwpe_stream_intf_stream__D10* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+              Vtop_hwpe_stream_intf_stream__D10___ico_sequent__TOP__wrapper_hwpe_stream_split__DOT__pop_o__BRA__0__KET____0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.clk = vlSymsp->TOP.wrapper_hwpe_stream_split__DOT__clk_i;
+    vlSelfRef.ready = vlSymsp->TOP.wrapper_hwpe_stream_split__DOT__ready_o[0U];
+    vlSelfRef.valid = vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__push_i.valid;
+    vlSelfRef.data = (0x0000ffffU & vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__push_i.data);
+    vlSelfRef.strb = (3U & (IData)(vlSymsp->TOP__wrapper_hwpe_stream_split__DOT__push_i.strb));
+}
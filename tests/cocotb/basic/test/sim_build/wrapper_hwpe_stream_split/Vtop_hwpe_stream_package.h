@@ -0,0 +1,37 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP_HWPE_STREAM_PACKAGE_H_
+#define VERILATED_VTOP_HWPE_STREAM_PACKAGE_H_  // guard
+
+#include "verilated.h"
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop_hwpe_stream_package final {
+  public:
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr IData/*31:0*/ HWPE_STREAM_REALIGN_SOURCE = 0U;
+    static constexpr IData/*31:0*/ HWPE_STREAM_REALIGN_SINK = 1U;
+    static constexpr IData/*31:0*/ NB_SERDES_STREAMS_MAX = 0x00000400U;
+
+    // CONSTRUCTORS
+    Vtop_hwpe_stream_package();
+    ~Vtop_hwpe_stream_package();
+    void ctor(Vtop__Syms* symsp, const char* namep);
+    void dtor();
+    VL_UNCOPYABLE(Vtop_hwpe_stream_package);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
@@ -0,0 +1,277 @@
+#---------------------------------
+# Copyright 2023 KULeuven
+# Solderpad Hardware License, Version 0.51, see LICENSE for details.
+# SPDX-License-Identifier: SHL-0.51
+#---------------------------------
+
+#-----------------------------------
+# Importing useful tools
+#-----------------------------------
+import os
+import sys
+import time
+
+#-----------------------------------
+# Importing pytest
+#-----------------------------------
+import  pytest
+
+#-----------------------------------
+# Extracting and setting important variables and paths
+#-----------------------------------
+hwpe_stream_path = os.getenv("HWPE_STREAM_HOME",
+                             os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, hwpe_stream_path + "/util/perf")
+
+from hwpe_stream_perf import Pipeline, validation_pipeline
+
+
+#-----------------------------------
+# Helpers
+#-----------------------------------
+def chain(*stages, width=32, valid_rate=1.0, ready_rate=1.0):
+    pipeline = Pipeline()
+    pipeline.add('in', 'producer', {'DATA_WIDTH': width, 'VALID_RATE': valid_rate})
+    prev = 'in'
+    for name, kind, params in stages:
+        pipeline.add(name, kind, params, [prev])
+        prev = name
+    pipeline.add('out', 'consumer', {'DATA_WIDTH': width, 'READY_RATE': ready_rate}, [prev])
+    return pipeline
+
+
+#-----------------------------------
+# Rate bounds
+#-----------------------------------
+@pytest.mark.parametrize("valid_rates, ready_rate, expected", [
+    ([1.0, 1.0, 1.0, 1.0], 1.0,  1.0),
+    ([0.5, 1.0, 1.0, 1.0], 1.0,  0.5),
+    ([1.0, 1.0, 1.0, 1.0], 0.25, 0.25),
+    # all inputs must be valid in the same cycle
+    ([0.75, 0.5, 0.9, 1.0], 0.8, 0.75*0.5*0.9),
+])
+def test_merge_rate(valid_rates, ready_rate, expected):
+    result = validation_pipeline('merge', valid_rates, [ready_rate]).estimate()
+    assert result.throughput == pytest.approx(expected)
+    assert result.reason == 'rate'
+    assert result.sink_throughput['out0']['bits_per_cycle'] == pytest.approx(expected*64)
+
+
+def test_split_limiting_stage():
+    result = validation_pipeline('split', [0.9], [0.6, 0.8, 1.0, 0.7]).estimate()
+    # all outputs must be ready in the same cycle
+    assert result.throughput == pytest.approx(0.6*0.8*0.7)
+    assert result.limiting == ['dut']
+    assert result.utilization['in0'] == pytest.approx(0.6*0.8*0.7/0.9)
+
+
+def test_serialize_deserialize():
+    pipeline = Pipeline()
+    pipeline.add('in', 'producer', {'DATA_WIDTH': 32})
+    pipeline.add('des', 'deserialize', {'NB_OUT_STREAMS': 4, 'DATA_WIDTH': 32}, ['in'])
+    pipeline.add('ser', 'serialize', {'NB_IN_STREAMS': 4, 'DATA_WIDTH': 32}, ['des']*4)
+    pipeline.add('out', 'consumer', {'DATA_WIDTH': 32}, ['ser'])
+    result = pipeline.estimate()
+    assert result.repetitions == {'in': 4, 'des': 1, 'ser': 1, 'out': 4}
+    assert result.throughput == pytest.approx(0.25)
+    assert result.sink_throughput['out']['tokens_per_cycle'] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("decoupled, expected", [(0, 0.81), (1, 0.9)])
+def test_source_grant_rate(decoupled, expected):
+    pipeline = Pipeline()
+    pipeline.add('src', 'hwpe_stream_source',
+                 {'DATA_WIDTH': 64, 'GNT_RATE': 0.9, 'DECOUPLED': decoupled, 'TCDM_FIFO_DEPTH': 2})
+    pipeline.add('out', 'consumer', {'DATA_WIDTH': 64}, ['src'])
+    assert pipeline.estimate().throughput == pytest.approx(expected)
+
+
+#-----------------------------------
+# Buffering bounds and latency
+#-----------------------------------
+@pytest.mark.parametrize("depth, expected", [(1, 0.5), (2, 1.0), (8, 1.0)])
+def test_fifo_depth(depth, expected):
+    result = chain(('fifo', 'fifo', {'DATA_WIDTH': 32, 'FIFO_DEPTH': depth})).estimate()
+    # exact bounds must not pick up rounding from the cycle ratio solver
+    assert result.throughput == expected
+    assert result.latency == 1
+    if expected < 1.0:
+        assert result.reason == 'buffering'
+        assert 'fifo' in result.limiting
+
+
+def test_memory_latency():
+    pipeline = Pipeline()
+    pipeline.add('src', 'source', {'DATA_WIDTH': 32, 'MEM_LATENCY': 4,
+                                   'DECOUPLED': 1, 'TCDM_FIFO_DEPTH': 2})
+    pipeline.add('out', 'consumer', {'DATA_WIDTH': 32}, ['src'])
+    result = pipeline.estimate()
+    # two outstanding loads over a 4+1 cycle round trip
+    assert result.throughput == 2/5
+    assert result.latency == 4
+
+
+def fork_join(lanes):
+    pipeline = Pipeline()
+    pipeline.add('in', 'producer', {'DATA_WIDTH': 64})
+    pipeline.add('split', 'split', {'NB_OUT_STREAMS': 2, 'DATA_WIDTH_IN': 64}, ['in'])
+    inputs = []
+    for i, stages in enumerate(lanes):
+        prev = 'split'
+        for j, kind in enumerate(stages):
+            pipeline.add(f"lane{i}_{j}", kind, {'DATA_WIDTH': 32, 'FIFO_DEPTH': 4}, [prev])
+            prev = f"lane{i}_{j}"
+        inputs.append(prev)
+    pipeline.add('merge', 'merge', {'NB_IN_STREAMS': 2, 'DATA_WIDTH_IN': 32}, inputs)
+    pipeline.add('out', 'consumer', {'DATA_WIDTH': 64}, ['merge'])
+    return pipeline
+
+
+def test_unbalanced_fork_join():
+    # the merge pops the direct lane before the FIFO lane is valid
+    with pytest.raises(ValueError, match="1 cycle\\(s\\) apart"):
+        fork_join([['fifo'], []]).estimate()
+
+
+def test_balanced_fork_join():
+    result = fork_join([['fifo'], ['buffer']]).estimate()
+    assert result.throughput == 1.0
+    assert result.latency == 1
+
+
+def test_buffer_chain():
+    stages = [(f"buf{i}", 'buffer', {'DATA_WIDTH': 32}) for i in range(5)]
+    result = chain(*stages).estimate()
+    assert result.throughput == pytest.approx(1.0)
+    assert result.latency == 5
+    assert result.critical_path == ['in'] + [f"buf{i}" for i in range(5)] + ['out']
+    assert result.cycles(100) == pytest.approx(5 + 99)
+
+
+def test_large_pipeline():
+    stages = []
+    for i in range(10000):
+        kind = 'fifo' if i % 2 else 'buffer'
+        stages.append((f"s{i}", kind, {'DATA_WIDTH': 32, 'FIFO_DEPTH': 2}))
+    pipeline = chain(*stages, ready_rate=0.5)
+    start = time.perf_counter()
+    result = pipeline.estimate()
+    # a fraction of a second in practice, the bound only catches a
+    # superlinear regression
+    assert time.perf_counter() - start < 5.0
+    assert result.throughput == pytest.approx(0.5)
+    assert result.limiting == ['out']
+
+
+def test_large_fork_join():
+    pipeline = Pipeline()
+    pipeline.add('in', 'producer', {'DATA_WIDTH': 64})
+    prev = 'in'
+    for i in range(2000):
+        pipeline.add(f"split{i}", 'split', {'NB_OUT_STREAMS': 2, 'DATA_WIDTH_IN': 64}, [prev])
+        pipeline.add(f"a{i}", 'fifo', {'DATA_WIDTH': 32, 'FIFO_DEPTH': 2}, [f"split{i}"])
+        pipeline.add(f"b{i}", 'fifo', {'DATA_WIDTH': 32, 'FIFO_DEPTH': 2 if i else 1},
+                     [f"split{i}"])
+        pipeline.add(f"merge{i}", 'merge', {'NB_IN_STREAMS': 2, 'DATA_WIDTH_IN': 32},
+                     [f"a{i}", f"b{i}"])
+        prev = f"merge{i}"
+    pipeline.add('out', 'consumer', {'DATA_WIDTH': 64}, [prev])
+    start = time.perf_counter()
+    result = pipeline.estimate()
+    assert time.perf_counter() - start < 5.0
+    assert result.throughput == 0.5
+    assert result.reason == 'buffering'
+    assert 'b0' in result.limiting
+
+
+#-----------------------------------
+# Description errors
+#-----------------------------------
+def test_width_mismatch():
+    pipeline = Pipeline()
+    pipeline.add('in', 'producer', {'DATA_WIDTH': 32})
+    pipeline.add('merge', 'merge', {'NB_IN_STREAMS': 2, 'DATA_WIDTH_IN': 16}, ['in', 'in'])
+    with pytest.raises(ValueError, match="width mismatch"):
+        pipeline.estimate()
+
+
+def test_point_to_point():
+    pipeline = Pipeline()
+    pipeline.add('in', 'producer', {'DATA_WIDTH': 32})
+    pipeline.add('a', 'consumer', {'DATA_WIDTH': 32}, ['in'])
+    pipeline.add('b', 'consumer', {'DATA_WIDTH': 32}, ['in'])
+    with pytest.raises(ValueError, match="point-to-point"):
+        pipeline.estimate()
+
+
+def test_transparent_loop():
+    pipeline = Pipeline()
+    pipeline.add('a', 'assign', {'DATA_WIDTH': 32}, ['b'])
+    pipeline.add('b', 'assign', {'DATA_WIDTH': 32}, ['a'])
+    with pytest.raises(ValueError, match="combinational loop"):
+        pipeline.estimate()
+
+
+@pytest.mark.parametrize("kind, params", [
+    ('split',       {'NB_OUT_STREAMS': 0, 'DATA_WIDTH_IN': 64}),
+    ('merge',       {'NB_IN_STREAMS': 0, 'DATA_WIDTH_IN': 32}),
+    ('deserialize', {'NB_OUT_STREAMS': 2, 'DATA_WIDTH': 32, 'NB_CONTIG': 0}),
+    ('fifo',        {'DATA_WIDTH': 32, 'FIFO_DEPTH': 0}),
+])
+def test_invalid_count(kind, params):
+    pipeline = Pipeline()
+    with pytest.raises(ValueError, match="must be at least 1"):
+        pipeline.add('stage', kind, params)
+
+
+def test_narrow_source():
+    pipeline = Pipeline()
+    pipeline.add('src', 'source', {'DATA_WIDTH': 16, 'GNT_RATE': 0.5})
+    pipeline.add('out', 'consumer', {'DATA_WIDTH': 16}, ['src'])
+    assert pipeline.estimate().throughput == pytest.approx(0.5)
+
+
+def test_split_to_serialize():
+    pipeline = Pipeline()
+    pipeline.add('in', 'producer', {'DATA_WIDTH': 64})
+    pipeline.add('split', 'split', {'NB_OUT_STREAMS': 2, 'DATA_WIDTH_IN': 64}, ['in'])
+    pipeline.add('ser', 'serialize', {'NB_IN_STREAMS': 2, 'DATA_WIDTH': 32}, ['split']*2)
+    pipeline.add('out', 'consumer', {'DATA_WIDTH': 32}, ['ser'])
+    with pytest.raises(ValueError, match="FIFO on each lane"):
+        pipeline.estimate()
+
+
+@pytest.mark.parametrize("lane", ['assign', 'buffer', 'fifo'])
+def test_deserialize_to_merge(lane):
+    pipeline = Pipeline()
+    pipeline.add('in', 'producer', {'DATA_WIDTH': 32})
+    pipeline.add('des', 'deserialize', {'NB_OUT_STREAMS': 2, 'DATA_WIDTH': 32}, ['in'])
+    for i in range(2):
+        pipeline.add(f"lane{i}", lane, {'DATA_WIDTH': 32, 'FIFO_DEPTH': 2}, ['des'])
+    pipeline.add('merge', 'merge', {'NB_IN_STREAMS': 2, 'DATA_WIDTH_IN': 32},
+                 ['lane0', 'lane1'])
+    pipeline.add('out', 'consumer', {'DATA_WIDTH': 64}, ['merge'])
+    # with a FIFO on each lane, the lanes still reach the merge one cycle apart
+    match = "cycle\\(s\\) apart" if lane == 'fifo' else "FIFO on each lane"
+    with pytest.raises(ValueError, match=match):
+        pipeline.estimate()
+
+
+def test_deserialize_to_fence():
+    # the fence registers the lanes as they arrive
+    pipeline = Pipeline()
+    pipeline.add('in', 'producer', {'DATA_WIDTH': 32})
+    pipeline.add('des', 'deserialize', {'NB_OUT_STREAMS': 2, 'DATA_WIDTH': 32}, ['in'])
+    pipeline.add('fence', 'fence', {'NB_STREAMS': 2, 'DATA_WIDTH': 32}, ['des']*2)
+    pipeline.add('merge', 'merge', {'NB_IN_STREAMS': 2, 'DATA_WIDTH_IN': 32}, ['fence']*2)
+    pipeline.add('out', 'consumer', {'DATA_WIDTH': 64}, ['merge'])
+    assert pipeline.estimate().throughput == pytest.approx(0.5)
+
+
+def test_example_pipeline():
+    path = hwpe_stream_path + "/util/perf/examples/source_fence_merge.yml"
+    result = Pipeline.from_yaml(path).estimate()
+    assert result.throughput == pytest.approx(0.4)
+    assert result.limiting == ['src_a']
+    assert result.latency == 3
+    assert result.critical_path[-2:] == ['ser', 'dst']
@@ -0,0 +1,984 @@
+#!/usr/bin/env python3
+#---------------------------------
+# Copyright 2023 KULeuven
+# Solderpad Hardware License, Version 0.51, see LICENSE for details.
+# SPDX-License-Identifier: SHL-0.51
+#---------------------------------
+
+"""
+Static throughput/latency estimator for composed HWPE-Stream pipelines.
+
+A pipeline is described declaratively (YAML or a plain dict) as a list of
+stages built from the modules in `rtl/`, each with its RTL parameters and
+the list of stages driving its input ports::
+
+    pipeline:
+      name: merge_example
+      stages:
+        - {name: a,     type: producer, params: {DATA_WIDTH: 32, VALID_RATE: 0.5}}
+        - {name: b,     type: producer, params: {DATA_WIDTH: 32}}
+        - {name: fifo,  type: fifo,     params: {DATA_WIDTH: 32, FIFO_DEPTH: 2}, inputs: [b]}
+        - {name: merge, type: merge,    params: {NB_IN_STREAMS: 2, DATA_WIDTH_IN: 32},
+           inputs: [a, fifo]}
+        - {name: out,   type: consumer, params: {DATA_WIDTH: 64}, inputs: [merge]}
+
+Each stage is abstracted by:
+
+* its token rates on the input/output ports (synchronous dataflow), from
+  which a repetition vector `r` (firings per pipeline iteration) is solved;
+* `rate`, the maximum number of firings per cycle;
+* `latency`, the cycles from accepting an input to presenting the output;
+* `capacity`, the number of output tokens the stage can hold in flight;
+* `ready_latency`, the cycles before a freed slot is visible on `ready`.
+
+Besides the RTL parameters, a few model-only inputs describe what the RTL
+leaves to the environment or to runtime configuration: `VALID_RATE` and
+`READY_RATE` (pipeline ends), `GNT_RATE` and `MEM_LATENCY` (TCDM) and
+`NB_CONTIG` (serdes contiguity, `ctrl_i.nb_contig_m1 + 1` at runtime,
+bounded by the `CONTIG_LIMIT` parameter).
+
+The steady-state throughput (iterations/cycle) is bounded by every stage
+(`rate / r`) and by every cycle of the elastic constraint graph, where a
+stage's output holds at most `capacity` tokens until all its consumers
+accept them. The latter is a maximum cycle ratio problem, solved with
+Howard's policy iteration on each reconvergent (2-edge-connected) part of
+the pipeline only, so the analysis stays linear in the number of
+connections. Zero-load latency is the longest latency path from a source
+to a sink.
+
+The model assumes the stalls of the pipeline ends are independent: a side
+handshaking all its lanes in the same cycle (merge inputs, split and fence
+outputs) is available for the product of the rates of the ends it reaches.
+The `validate` mode compares it against throughput measured by Verilator
+runs of the `wrapper_hwpe_stream_merge` and `wrapper_hwpe_stream_split`
+cocotb wrappers.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from fractions import Fraction
+
+#-----------------------------------
+# Stage models
+#-----------------------------------
+
+# Zero capacities are replaced by this when searching for the critical
+# cycle, so that cycles which can never be filled come out as the largest
+# ratio; the ratio of the critical cycle is then recomputed exactly.
+_EPSILON_CAPACITY = 1e-9
+
+
+class Stage:
+    """
+    Analytical model of a single pipeline stage.
+
+    `consume` and `produce` list the tokens consumed/produced per firing on
+    each input/output port; `in_width` and `out_width` are the expected
+    stream widths (None means "any width"). `in_handshake` and
+    `out_handshake` tell whether the lanes of a multi-port side are
+    'independent', handshake in the same cycle ('joint') or one after the
+    other ('sequential'). `transparent` stages forward ready combinationally
+    and do not decouple the handshakes on either side.
+    """
+
+    def __init__(self, name, kind, consume, produce, rate=1.0, latency=0,
+                 capacity=0, ready_latency=0, in_width=None, out_width=None,
+                 in_handshake='independent', out_handshake='independent',
+                 transparent=False):
+        self.name          = name
+        self.kind          = kind
+        self.consume       = list(consume)
+        self.produce       = list(produce)
+        self.rate          = float(rate)
+        self.latency       = latency
+        self.capacity      = capacity
+        self.ready_latency = ready_latency
+        self.in_width      = in_width
+        self.out_width     = out_width
+        self.in_handshake  = in_handshake
+        self.out_handshake = out_handshake
+        self.transparent   = transparent
+        self.inputs        = []
+        self.outputs       = []
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, {self.kind!r})"
+
+
+def _param(params, key, default):
+    value = params.get(key, default)
+    if value is None:
+        raise ValueError(f"missing required parameter {key}")
+    return value
+
+
+def _check_count(value, key):
+    if value < 1:
+        raise ValueError(f"{key} must be at least 1, got {value}")
+    return value
+
+
+def _check_rate(value, key):
+    if not 0.0 < value <= 1.0:
+        raise ValueError(f"{key} must be in (0, 1], got {value}")
+    return value
+
+
+def _producer(name, params):
+    width = _param(params, 'DATA_WIDTH', 32)
+    rate  = _check_rate(float(params.get('VALID_RATE', 1.0)), 'VALID_RATE')
+    return Stage(name, 'producer', [], [1], rate=rate, out_width=width)
+
+
+def _consumer(name, params):
+    width = _param(params, 'DATA_WIDTH', 32)
+    rate  = _check_rate(float(params.get('READY_RATE', 1.0)), 'READY_RATE')
+    return Stage(name, 'consumer', [1], [], rate=rate, in_width=width)
+
+
+def _assign(name, params):
+    width = params.get('DATA_WIDTH')
+    return Stage(name, 'assign', [1], [1], in_width=width, out_width=width,
+                 transparent=True)
+
+
+def _buffer(name, params):
+    width = _param(params, 'DATA_WIDTH', 32)
+    # register on data/valid, ready is combinationally forwarded
+    return Stage(name, 'buffer', [1], [1], latency=1, capacity=1,
+                 in_width=width, out_width=width, transparent=True)
+
+
+def _fifo(name, params):
+    width = _param(params, 'DATA_WIDTH', 32)
+    depth = _check_count(_param(params, 'FIFO_DEPTH', 8), 'FIFO_DEPTH')
+    # ready is a function of the FIFO state only, so a slot freed by a pop
+    # is visible to the producer one cycle later
+    return Stage(name, 'fifo', [1], [1], latency=1, capacity=depth,
+                 ready_latency=1, in_width=width, out_width=width)
+
+
+def _fifo_earlystall(name, params):
+    width = _param(params, 'DATA_WIDTH', 32)
+    depth = _param(params, 'FIFO_DEPTH', 8)
+    if depth < 2:
+        raise ValueError(f"FIFO_DEPTH must be at least 2, got {depth}")
+    # stalls one entry early, which hides the registered ready
+    return Stage(name, 'fifo_earlystall', [1], [1], latency=1,
+                 capacity=depth-1, in_width=width, out_width=width)
+
+
+def _merge(name, params):
+    nb    = _check_count(_param(params, 'NB_IN_STREAMS', 2), 'NB_IN_STREAMS')
+    width = _param(params, 'DATA_WIDTH_IN', 32)
+    # valid only when all inputs are valid
+    return Stage(name, 'merge', [1]*nb, [1], in_width=width,
+                 out_width=width*nb, in_handshake='joint')
+
+
+def _split(name, params):
+    nb    = _check_count(_param(params, 'NB_OUT_STREAMS', 2), 'NB_OUT_STREAMS')
+    width = _param(params, 'DATA_WIDTH_IN', 128)
+    if width % nb != 0:
+        raise ValueError(f"DATA_WIDTH_IN={width} is not divisible by NB_OUT_STREAMS={nb}")
+    # ready only when all outputs are ready
+    return Stage(name, 'split', [1], [1]*nb, in_width=width,
+                 out_width=width//nb, out_handshake='joint')
+
+
+def _fence(name, params):
+    nb    = _check_count(_param(params, 'NB_STREAMS', 2), 'NB_STREAMS')
+    width = _param(params, 'DATA_WIDTH', 32)
+    # each lane registers an early input, then all lanes fire together
+    return Stage(name, 'fence', [1]*nb, [1]*nb, capacity=1, in_width=width,
+                 out_width=width, out_handshake='joint')
+
+
+def _serialize(name, params):
+    nb     = _check_count(_param(params, 'NB_IN_STREAMS', 2), 'NB_IN_STREAMS')
+    width  = _param(params, 'DATA_WIDTH', 32)
+    # runtime ctrl_i.nb_contig_m1+1, not a design-time parameter
+    contig = _check_count(params.get('NB_CONTIG', 1), 'NB_CONTIG')
+    # one firing is a full round over the input streams, one output per
+    # cycle; only the input selected by the stream counter is ready
+    return Stage(name, 'serialize', [contig]*nb, [nb*contig],
+                 rate=1.0/(nb*contig), in_width=width, out_width=width,
+                 in_handshake='sequential')
+
+
+def _deserialize(name, params):
+    nb     = _check_count(_param(params, 'NB_OUT_STREAMS', 2), 'NB_OUT_STREAMS')
+    width  = _param(params, 'DATA_WIDTH', 32)
+    contig = _check_count(params.get('NB_CONTIG', 1), 'NB_CONTIG')
+    # only the output selected by the stream counter is valid
+    return Stage(name, 'deserialize', [nb*contig], [contig]*nb,
+                 rate=1.0/(nb*contig), in_width=width, out_width=width,
+                 out_handshake='sequential')
+
+
+def _tcdm_ports(params):
+    width = _param(params, 'DATA_WIDTH', 32)
+    ports = _check_count(params.get('NB_TCDM_PORTS', max(1, width // 32)),
+                         'NB_TCDM_PORTS')
+    gnt   = _check_rate(float(params.get('GNT_RATE', 1.0)), 'GNT_RATE')
+    return width, ports, gnt
+
+
+def _source(name, params):
+    width, ports, gnt = _tcdm_ports(params)
+    mem_latency = params.get('MEM_LATENCY', 1)
+    if params.get('DECOUPLED', 0):
+        # grants are collected per port by the internal fence, outstanding
+        # loads are bounded by the external hwpe_stream_tcdm_fifo_load
+        rate          = gnt
+        capacity      = _param(params, 'TCDM_FIFO_DEPTH', 2)
+        ready_latency = 1
+    else:
+        # a load is issued only when all ports grant in the same cycle
+        rate          = gnt ** ports
+        capacity      = 1
+        ready_latency = 0
+    return Stage(name, 'source', [], [1], rate=rate, latency=mem_latency,
+                 capacity=capacity, ready_latency=ready_latency,
+                 out_width=width)
+
+
+def _sink(name, params):
+    width, ports, gnt = _tcdm_ports(params)
+    depth = params.get('TCDM_FIFO_DEPTH', 2)
+    # per-port store FIFOs absorb grants arriving on different cycles,
+    # without them the split needs all ports to grant in the same cycle
+    rate = gnt if depth > 0 else gnt ** ports
+    return Stage(name, 'sink', [1], [], rate=rate, in_width=width)
+
+
+STAGE_TYPES = {
+    'producer'        : _producer,
+    'consumer'        : _consumer,
+    'assign'          : _assign,
+    'mux_static'      : _assign,
+    'demux_static'    : _assign,
+    'buffer'          : _buffer,
+    'fifo'            : _fifo,
+    'fifo_sidech'     : _fifo,
+    'fifo_earlystall' : _fifo_earlystall,
+    'fifo_earlystall_sidech' : _fifo_earlystall,
+    'merge'           : _merge,
+    'split'           : _split,
+    'fence'           : _fence,
+    'serialize'       : _serialize,
+    'deserialize'     : _deserialize,
+    'source'          : _source,
+    'sink'            : _sink,
+}
+
+
+def make_stage(name, kind, params=None):
+    """Build the model of a stage of type `kind` (with or without the `hwpe_stream_` prefix)."""
+    if kind.startswith('hwpe_stream_'):
+        kind = kind[len('hwpe_stream_'):]
+    if kind not in STAGE_TYPES:
+        raise ValueError(f"stage {name}: unknown type {kind}")
+    try:
+        stage = STAGE_TYPES[kind](name, dict(params or {}))
+    except ValueError as exc:
+        raise ValueError(f"stage {name}: {exc}") from None
+    return stage
+
+#-----------------------------------
+# Pipeline graph
+#-----------------------------------
+
+class Pipeline:
+    """
+    Graph of connected stages. Input ports are bound in the order given in
+    each stage's `inputs` list; a multi-output stage binds its output ports
+    in the order in which the consumers are declared.
+    """
+
+    def __init__(self, name='pipeline'):
+        self.name   = name
+        self.stages = {}
+
+    def add(self, name, kind, params=None, inputs=()):
+        if name in self.stages:
+            raise ValueError(f"duplicate stage name {name}")
+        stage = make_stage(name, kind, params)
+        stage.inputs = list(inputs)
+        self.stages[name] = stage
+        return stage
+
+    @classmethod
+    def from_dict(cls, desc):
+        desc = desc.get('pipeline', desc)
+        pipeline = cls(desc.get('name', 'pipeline'))
+        for entry in desc['stages']:
+            pipeline.add(entry['name'], entry['type'], entry.get('params'),
+                         entry.get('inputs', ()))
+        return pipeline
+
+    @classmethod
+    def from_yaml(cls, path):
+        import yaml
+        with open(path, 'r') as f:
+            return cls.from_dict(yaml.safe_load(f))
+
+    def edges(self):
+        """
+        Check the connectivity and return the list of connections as
+        `(producer, out_port, consumer, in_port)` tuples.
+        """
+        for stage in self.stages.values():
+            stage.outputs = []
+        edges = []
+        for stage in self.stages.values():
+            if len(stage.inputs) != len(stage.consume):
+                raise ValueError(f"stage {stage.name}: expected {len(stage.consume)} "
+                                 f"input(s), got {len(stage.inputs)}")
+            for in_port, src_name in enumerate(stage.inputs):
+                if src_name not in self.stages:
+                    raise ValueError(f"stage {stage.name}: unknown input {src_name}")
+                src = self.stages[src_name]
+                out_port = len(src.outputs)
+                if out_port >= len(src.produce):
+                    raise ValueError(f"stage {src.name}: too many consumers, HWPE-Streams "
+                                     f"are point-to-point (use a split)")
+                if (src.out_width is not None and stage.in_width is not None
+                        and src.out_width != stage.in_width):
+                    raise ValueError(f"width mismatch on {src.name} -> {stage.name}: "
+                                     f"{src.out_width} != {stage.in_width}")
+                src.outputs.append(stage.name)
+                edges.append((src.name, out_port, stage.name, in_port))
+        for stage in self.stages.values():
+            if len(stage.outputs) != len(stage.produce):
+                raise ValueError(f"stage {stage.name}: expected {len(stage.produce)} "
+                                 f"consumer(s), got {len(stage.outputs)}")
+        self._check_handshakes()
+        self._check_alignment(edges)
+        return edges
+
+    def _check_handshakes(self):
+        """
+        Reject lanes going from a stage that handshakes them one at a time
+        to a stage that needs them all in the same cycle (or vice versa),
+        which never completes a transfer without a FIFO on each lane.
+        """
+        for stage in self.stages.values():
+            for name in stage.inputs:
+                src = self.stages[name]
+                seen = {stage.name}
+                while src.transparent:
+                    if src.name in seen:
+                        raise ValueError(f"pipeline contains a combinational loop "
+                                         f"through {src.name}")
+                    seen.add(src.name)
+                    src = self.stages[src.inputs[0]]
+                if {src.out_handshake, stage.in_handshake} == {'joint', 'sequential'}:
+                    raise ValueError(f"{src.kind} {src.name} -> {stage.kind} {stage.name}: "
+                                     f"lanes handshake in different cycles on one side and in "
+                                     f"the same cycle on the other, put a FIFO on each lane")
+
+    def _check_alignment(self, edges):
+        """
+        Reject merges whose lanes reach them in different cycles relative to
+        each other, e.g. two lanes of a split with different latencies. The
+        merge broadcasts its ready to all inputs, so it pops the early lane
+        while its output is not valid and the data is lost.
+        """
+        # weighted union-find: stage -> (parent, cycles from parent to the
+        # stage's output being valid)
+        parent = {name: (name, 0) for name in self.stages}
+
+        def find(name):
+            path, offset = [], 0
+            while parent[name][0] != name:
+                path.append(name)
+                offset += parent[name][1]
+                name = parent[name][0]
+            for node in path:
+                delay = parent[node][1]
+                parent[node] = (name, offset)
+                offset -= delay
+            return name, parent[path[0]][1] if path else 0
+
+        inputs = {}
+        for src, out_port, dst, in_port in edges:
+            inputs.setdefault(dst, []).append((in_port, src, out_port))
+        # single-input stages only extend the trees, so the offsets can
+        # only disagree at the merges, which are linked last
+        def joint(name):
+            return self.stages[name].in_handshake == 'joint'
+
+        for name in sorted(inputs, key=joint):
+            lanes = inputs[name]
+            stage = self.stages[name]
+            if len(lanes) > 1 and not joint(name):
+                # fences and serializers take each lane on its own
+                continue
+            root, offset = find(name)
+            for in_port, src, out_port in sorted(lanes):
+                src_stage = self.stages[src]
+                delay = stage.latency
+                if src_stage.out_handshake == 'sequential':
+                    # one output after the other
+                    delay += sum(src_stage.produce[:out_port])
+                src_root, src_offset = find(src)
+                if src_root != root:
+                    # output of `name` is valid `delay` cycles after `src`
+                    parent[src_root] = (root, offset - delay - src_offset)
+                elif src_offset + delay != offset and joint(name):
+                    raise ValueError(f"{stage.kind} {stage.name}: lanes arrive "
+                                     f"{abs(src_offset + delay - offset)} cycle(s) apart, "
+                                     f"the early lane is dropped; balance their latency "
+                                     f"or put a fence in front of the {stage.kind}")
+
+    def estimate(self):
+        return estimate(self)
+
+#-----------------------------------
+# Analysis
+#-----------------------------------
+
+class Estimate:
+    """
+    Result of the static analysis. `throughput` is in pipeline iterations
+    per cycle; `sink_throughput` gives tokens/cycle and bits/cycle at each
+    stage without outputs.
+    """
+
+    def __init__(self, pipeline, repetitions, throughput, limiting, reason,
+                 latency, critical_path, utilization):
+        self.pipeline      = pipeline
+        self.repetitions   = repetitions
+        self.throughput    = throughput
+        self.limiting      = limiting
+        self.reason        = reason
+        self.latency       = latency
+        self.critical_path = critical_path
+        self.utilization   = utilization
+
+    @property
+    def deadlock(self):
+        return self.reason == 'deadlock'
+
+    def tokens_per_cycle(self, name):
+        stage = self.pipeline.stages[name]
+        tokens = sum(stage.consume) if stage.consume else sum(stage.produce)
+        return self.throughput * self.repetitions[name] * tokens
+
+    @property
+    def sink_throughput(self):
+        sinks = {}
+        for name, stage in self.pipeline.stages.items():
+            if not stage.produce:
+                tokens = self.tokens_per_cycle(name)
+                width  = stage.in_width or 0
+                sinks[name] = {'tokens_per_cycle': tokens, 'bits_per_cycle': tokens*width}
+        return sinks
+
+    def cycles(self, nb_iterations):
+        """Estimated cycles to run `nb_iterations` pipeline iterations."""
+        if self.throughput == 0:
+            return math.inf
+        return self.latency + (nb_iterations - 1) / self.throughput
+
+    def to_dict(self):
+        return {
+            'pipeline'        : self.pipeline.name,
+            'throughput'      : self.throughput,
+            'limiting'        : self.limiting,
+            'reason'          : self.reason,
+            'latency'         : self.latency,
+            'critical_path'   : self.critical_path,
+            'repetitions'     : self.repetitions,
+            'utilization'     : self.utilization,
+            'sink_throughput' : self.sink_throughput,
+        }
+
+    def report(self):
+        lines = [f"pipeline        : {self.pipeline.name}",
+                 f"throughput      : {self.throughput:.4f} iterations/cycle",
+                 f"limited by      : {', '.join(self.limiting)} ({self.reason})",
+                 f"latency         : {self.latency} cycles (zero-load)",
+                 f"critical path   : {' -> '.join(self.critical_path)}"]
+        for name, sink in self.sink_throughput.items():
+            lines.append(f"sink {name:<10} : {sink['tokens_per_cycle']:.4f} tokens/cycle, "
+                         f"{sink['bits_per_cycle']:.1f} bits/cycle")
+        lines.append("utilization     :")
+        for name, util in self.utilization.items():
+            lines.append(f"  {name:<14} {util*100:6.1f}%")
+        return '\n'.join(lines)
+
+
+def _repetitions(pipeline, edges):
+    """Solve the balance equations r[src]*produce = r[dst]*consume."""
+    adjacency = {name: [] for name in pipeline.stages}
+    for src, out_port, dst, in_port in edges:
+        produce = pipeline.stages[src].produce[out_port]
+        consume = pipeline.stages[dst].consume[in_port]
+        # most connections are 1:1, which keeps Fraction arithmetic out of
+        # the common path
+        ratio = 1 if produce == consume else Fraction(produce, consume)
+        adjacency[src].append((dst, ratio))
+        adjacency[dst].append((src, 1/ratio if ratio != 1 else 1))
+
+    reps = {}
+    for root in pipeline.stages:
+        if root in reps:
+            continue
+        component = [root]
+        reps[root] = Fraction(1)
+        stack = [root]
+        while stack:
+            name = stack.pop()
+            for other, ratio in adjacency[name]:
+                value = reps[name] if ratio == 1 else reps[name] * ratio
+                if other not in reps:
+                    reps[other] = value
+                    component.append(other)
+                    stack.append(other)
+                elif reps[other] != value:
+                    raise ValueError(f"inconsistent token rates between {name} and {other}")
+        # normalize each connected component to the smallest integers
+        scale = math.lcm(*{reps[name].denominator for name in component})
+        for name in component:
+            reps[name] = reps[name].numerator * (scale // reps[name].denominator)
+        common = math.gcd(*{reps[name] for name in component})
+        for name in component:
+            reps[name] //= common
+    return reps
+
+
+def _edge_components(nodes, links):
+    """
+    Split the undirected multigraph `links`, given as `(u, v)` tuples, into
+    its 2-edge-connected components. Returns lists of link indices, with
+    each bridge in a list of its own.
+    """
+    adjacency = {u: [] for u in nodes}
+    for index, (u, v) in enumerate(links):
+        adjacency[u].append((v, index))
+        adjacency[v].append((u, index))
+
+    # iterative Tarjan, skipping only the link to the parent so that
+    # parallel links are not mistaken for bridges
+    order, low, bridges = {}, {}, set()
+    for root in nodes:
+        if root in order:
+            continue
+        order[root] = low[root] = len(order)
+        stack = [(root, None, iter(adjacency[root]))]
+        while stack:
+            u, via, todo = stack[-1]
+            for v, index in todo:
+                if index == via:
+                    continue
+                if v in order:
+                    low[u] = min(low[u], order[v])
+                else:
+                    order[v] = low[v] = len(order)
+                    stack.append((v, index, iter(adjacency[v])))
+                    break
+            else:
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    low[parent] = min(low[parent], low[u])
+                    if low[u] > order[parent]:
+                        bridges.add(via)
+
+    label, components = {}, []
+    for root in nodes:
+        if root in label:
+            continue
+        label[root] = len(components)
+        components.append([])
+        stack = [root]
+        while stack:
+            u = stack.pop()
+            for v, index in adjacency[u]:
+                if index not in bridges and v not in label:
+                    label[v] = label[root]
+                    stack.append(v)
+    for index, (u, v) in enumerate(links):
+        if index in bridges:
+            components.append([index])
+        else:
+            components[label[u]].append(index)
+    return [component for component in components if component]
+
+
+def _max_cycle_ratio(nodes, arcs):
+    """
+    Maximum of sum(w)/sum(t) over all cycles of the graph `arcs`, given as
+    `(u, v, w, t, ...)` tuples with t > 0, using Howard's policy iteration.
+    Returns `(ratio, cycle)` with the arcs of a critical cycle, or
+    `(0.0, [])` if the graph is acyclic.
+    """
+    out = {u: [] for u in nodes}
+    for arc in arcs:
+        out[arc[0]].append(arc)
+
+    # nodes without successors cannot be on a cycle
+    alive = set(nodes)
+    pruned = True
+    while pruned:
+        pruned = False
+        for u in list(alive):
+            out[u] = [a for a in out[u] if a[1] in alive]
+            if not out[u]:
+                alive.discard(u)
+                pruned = True
+    if not alive:
+        return 0.0, []
+
+    policy = {u: max(out[u], key=lambda a: a[2]/a[3]) for u in alive}
+    eps = 1e-12
+
+    # Howard's iteration terminates in a handful of rounds in practice, the
+    # bound only guards against floating-point ties flipping the policy
+    for _ in range(len(arcs) + 16):
+        # value determination on the functional graph of the policy
+        eta, value, cycle_of = {}, {}, {}
+        for start in alive:
+            if start in eta:
+                continue
+            path, on_path = [], {}
+            u = start
+            while u not in eta and u not in on_path:
+                on_path[u] = len(path)
+                path.append(u)
+                u = policy[u][1]
+            if u in on_path:
+                cycle = path[on_path[u]:]
+                ratio = (sum(policy[c][2] for c in cycle) /
+                         sum(policy[c][3] for c in cycle))
+                eta[u], value[u] = ratio, 0.0
+                for c in reversed(cycle[1:]):
+                    arc = policy[c]
+                    eta[c] = ratio
+                    value[c] = arc[2] - ratio*arc[3] + value[arc[1]]
+                for c in cycle:
+                    cycle_of[c] = cycle
+                path = path[:on_path[u]]
+            for c in reversed(path):
+                arc = policy[c]
+                eta[c] = eta[arc[1]]
+                value[c] = arc[2] - eta[c]*arc[3] + value[arc[1]]
+                cycle_of[c] = cycle_of[arc[1]]
+
+        # policy improvement, first on the cycle ratio then on the values
+        changed = False
+        for u in alive:
+            best = max(out[u], key=lambda a: eta[a[1]])
+            if eta[best[1]] > eta[u] + eps:
+                policy[u] = best
+                changed = True
+        if not changed:
+            for u in alive:
+                for arc in out[u]:
+                    if abs(eta[arc[1]] - eta[u]) > eps:
+                        continue
+                    candidate = arc[2] - eta[u]*arc[3] + value[arc[1]]
+                    if candidate > value[u] + eps*max(1.0, abs(value[u])):
+                        policy[u] = arc
+                        value[u] = candidate
+                        changed = True
+        if not changed:
+            break
+    critical = max(alive, key=lambda u: eta[u])
+    return eta[critical], [policy[u] for u in cycle_of[critical]]
+
+
+def _joint_rate(stages, stage):
+    """
+    Firings/cycle of `stage` when a side handshakes all its lanes in the
+    same cycle. Lanes ending, through transparent stages, at a pipeline end
+    are stalled independently of each other, so all of them are available
+    in only a product of their rates of the cycles (like the TCDM ports of
+    a non-decoupled source); buffered lanes are left to the buffering bound.
+    """
+    rate = stage.rate
+    ends = {}
+    if stage.in_handshake == 'joint':
+        for name in stage.inputs:
+            src = stages[name]
+            while src.transparent:
+                src = stages[src.inputs[0]]
+            if not src.inputs:
+                ends[src.name] = src.rate
+    if stage.out_handshake == 'joint':
+        for name in stage.outputs:
+            dst = stages[name]
+            while dst.transparent:
+                dst = stages[dst.outputs[0]]
+            if not dst.outputs:
+                ends[dst.name] = dst.rate
+    if len(ends) > 1:
+        rate = min(rate, math.prod(ends.values()))
+    return rate
+
+
+def estimate(pipeline):
+    """Compute the steady-state throughput bound, zero-load latency and limiting stages."""
+    edges  = pipeline.edges()
+    stages = pipeline.stages
+    reps   = _repetitions(pipeline, edges)
+
+    # per-stage rate bound
+    rates = {name: _joint_rate(stages, stage) for name, stage in stages.items()}
+    throughput, limiting, reason = math.inf, [], 'rate'
+    for name, stage in stages.items():
+        bound = rates[name] / reps[name]
+        if bound < throughput - 1e-12:
+            throughput, limiting = bound, [name]
+        elif bound <= throughput + 1e-12:
+            limiting.append(name)
+
+    # elastic buffering bound: a stage's output holds at most `capacity`
+    # tokens from the moment it is accepted until all consumers take it,
+    # and it takes `latency` cycles to become valid at the consumers;
+    # the last field of each arc is its real capacity
+    links, arcs = [], []
+    for src, out_port, dst, _ in edges:
+        stage = stages[src]
+        tokens = reps[src] * sum(stage.produce)
+        capacity = stage.capacity / tokens
+        links.append((src, dst))
+        arcs.append([(src, dst, stage.ready_latency,
+                      max(capacity, _EPSILON_CAPACITY), capacity),
+                     (dst, src, stage.latency, _EPSILON_CAPACITY, 0)])
+
+    # a cycle never leaves a 2-edge-connected component, and the only
+    # cycle through a bridge is the one between its two arcs, so Howard's
+    # iteration only runs on the (usually small) reconvergent parts
+    worst, cycle = 0.0, []
+    for component in _edge_components(list(stages), links):
+        candidate = [arc for index in component for arc in arcs[index]]
+        if not any(arc[2] for arc in candidate):
+            continue
+        if len(component) > 1:
+            nodes = list(dict.fromkeys(arc[0] for arc in candidate))
+            _, candidate = _max_cycle_ratio(nodes, candidate)
+        ratio = (sum(arc[2] for arc in candidate) /
+                 sum(arc[3] for arc in candidate)) if candidate else 0.0
+        if ratio > worst:
+            worst, cycle = ratio, candidate
+    delay    = sum(arc[2] for arc in cycle)
+    capacity = sum(arc[4] for arc in cycle)
+    if delay > 0:
+        bound = capacity / delay
+        if bound < throughput - 1e-12:
+            throughput = bound
+            limiting = list(dict.fromkeys(arc[0] for arc in cycle))
+            reason = 'buffering'
+            if capacity == 0:
+                reason = 'deadlock'
+
+    # zero-load latency, longest path in topological order
+    indegree = {name: len(stage.inputs) for name, stage in stages.items()}
+    ready = [name for name, deg in indegree.items() if deg == 0]
+    arrival = {name: 0 for name in stages}
+    parent = {name: None for name in stages}
+    order = []
+    while ready:
+        name = ready.pop()
+        order.append(name)
+        for dst in stages[name].outputs:
+            done = arrival[name] + stages[name].latency
+            if done > arrival[dst] or parent[dst] is None:
+                arrival[dst], parent[dst] = max(done, arrival[dst]), name
+            indegree[dst] -= 1
+            if indegree[dst] == 0:
+                ready.append(dst)
+    if len(order) != len(stages):
+        raise ValueError("pipeline contains a combinational loop")
+    finish = {name: arrival[name] + stages[name].latency
+              for name, stage in stages.items() if not stage.outputs}
+    last = max(finish, key=lambda name: finish[name]) if finish else None
+    path = []
+    while last is not None:
+        path.append(last)
+        last = parent[last]
+
+    utilization = {name: throughput * reps[name] / rates[name] for name in stages}
+    return Estimate(pipeline, reps, throughput, limiting, reason,
+                    max(finish.values(), default=0), path[::-1], utilization)
+
+#-----------------------------------
+# Validation against Verilator
+#-----------------------------------
+
+hwpe_stream_path = os.getenv("HWPE_STREAM_HOME",
+                             os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+# (wrapper, valid rates, ready rates) scenarios exercised by `validate`
+VALIDATION_SCENARIOS = [
+    ('merge', [1.0, 1.0, 1.0, 1.0], [1.0]),
+    ('merge', [0.5, 1.0, 1.0, 1.0], [1.0]),
+    ('merge', [1.0, 1.0, 1.0, 1.0], [0.25]),
+    ('merge', [0.75, 0.5, 0.9, 1.0], [0.8]),
+    ('split', [1.0], [1.0, 1.0, 1.0, 1.0]),
+    ('split', [0.5], [1.0, 1.0, 1.0, 1.0]),
+    ('split', [1.0], [0.5, 1.0, 1.0, 0.75]),
+    ('split', [0.9], [0.6, 0.8, 1.0, 0.7]),
+]
+
+
+def validation_pipeline(dut, valid_rates, ready_rates, data_width=16):
+    """Pipeline matching a cocotb wrapper driven by producers/consumers with the given rates."""
+    pipeline = Pipeline(f"wrapper_hwpe_stream_{dut}")
+    if dut == 'merge':
+        nb = len(valid_rates)
+        for i, rate in enumerate(valid_rates):
+            pipeline.add(f"in{i}", 'producer', {'DATA_WIDTH': data_width, 'VALID_RATE': rate})
+        pipeline.add('dut', 'merge', {'NB_IN_STREAMS': nb, 'DATA_WIDTH_IN': data_width},
+                     [f"in{i}" for i in range(nb)])
+        pipeline.add('out0', 'consumer', {'DATA_WIDTH': data_width*nb,
+                                          'READY_RATE': ready_rates[0]}, ['dut'])
+    elif dut == 'split':
+        nb = len(ready_rates)
+        pipeline.add('in0', 'producer', {'DATA_WIDTH': data_width*nb,
+                                         'VALID_RATE': valid_rates[0]})
+        pipeline.add('dut', 'split', {'NB_OUT_STREAMS': nb, 'DATA_WIDTH_IN': data_width*nb},
+                     ['in0'])
+        for i, rate in enumerate(ready_rates):
+            pipeline.add(f"out{i}", 'consumer', {'DATA_WIDTH': data_width, 'READY_RATE': rate},
+                         ['dut'])
+    else:
+        raise ValueError(f"no cocotb wrapper for {dut}")
+    return pipeline
+
+
+def measure(dut, valid_rates, ready_rates, stimulus='random', cycles=2000,
+            data_width=16, seed=0):
+    """
+    Measure the transfers/cycle through `wrapper_hwpe_stream_<dut>` with
+    Verilator, through the cocotb bench in `tb_hwpe_stream_perf.py`. A
+    transfer is a cycle in which every input and output port handshakes.
+    """
+    from cocotb_test.simulator import run
+    import yaml
+    import tempfile
+
+    with open(hwpe_stream_path + "/src_files.yml", "r") as src_files:
+        yaml_dict = yaml.safe_load(src_files)
+    rtl_sources     = [hwpe_stream_path + '/' + f for f in yaml_dict['hwpe-stream']['files']]
+    include_folders = [hwpe_stream_path + '/' + f for f in yaml_dict['hwpe-stream']['incdirs']]
+
+    toplevel = f"wrapper_hwpe_stream_{dut}"
+    rtl_sources.append(hwpe_stream_path + f"/tests/cocotb/basic/wrappers/{toplevel}.sv")
+    if dut == 'merge':
+        parameters = {'DATA_WIDTH': str(data_width), 'NB_IN_STREAMS': str(len(valid_rates))}
+    else:
+        parameters = {'DATA_WIDTH_IN': str(data_width*len(ready_rates)),
+                      'NB_OUT_STREAMS': str(len(ready_rates))}
+
+    build_name = f"{toplevel}_{'_'.join(parameters.values())}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result_path = os.path.join(tmp, 'result.json')
+        run(
+            includes        = include_folders,
+            verilog_sources = rtl_sources,
+            toplevel        = toplevel,
+            module          = "tb_hwpe_stream_perf",
+            python_search   = [os.path.dirname(os.path.abspath(__file__))],
+            simulator       = "verilator",
+            sim_build       = hwpe_stream_path + f"/util/perf/sim_build/{build_name}/",
+            parameters      = parameters,
+            extra_env       = {
+                'PERF_DUT'         : dut,
+                'PERF_VALID_RATES' : ','.join(str(r) for r in valid_rates),
+                'PERF_READY_RATES' : ','.join(str(r) for r in ready_rates),
+                'PERF_STIMULUS'    : stimulus,
+                'PERF_CYCLES'      : str(cycles),
+                'PERF_SEED'        : str(seed),
+                'PERF_RESULT'      : result_path,
+            },
+        )
+        with open(result_path, 'r') as f:
+            return json.load(f)['throughput']
+
+
+def validate(scenarios=VALIDATION_SCENARIOS, stimulus='random', cycles=2000, seed=0):
+    """
+    Compare predicted and Verilator-measured throughput, return one row per
+    scenario. The relative error is None when nothing was measured but a
+    non-zero throughput was predicted.
+    """
+    rows = []
+    for dut, valid_rates, ready_rates in scenarios:
+        predicted = validation_pipeline(dut, valid_rates, ready_rates).estimate().throughput
+        measured  = measure(dut, valid_rates, ready_rates, stimulus, cycles, seed=seed)
+        if measured:
+            error = (predicted - measured) / measured
+        else:
+            error = 0.0 if predicted == 0 else None
+        rows.append({
+            'dut'         : dut,
+            'valid_rates' : valid_rates,
+            'ready_rates' : ready_rates,
+            'predicted'   : predicted,
+            'measured'    : measured,
+            'error'       : error,
+        })
+    return rows
+
+#-----------------------------------
+# Command line
+#-----------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='cmd', required=True)
+
+    p_est = sub.add_parser('estimate', help='estimate throughput/latency of a pipeline')
+    p_est.add_argument('pipeline', help='YAML pipeline description')
+    p_est.add_argument('--iterations', type=int, help='also estimate cycles for N iterations')
+    p_est.add_argument('--json', action='store_true', help='print the result as JSON')
+
+    p_val = sub.add_parser('validate', help='compare predictions with Verilator runs '
+                                            'of the merge/split cocotb wrappers')
+    p_val.add_argument('--stimulus', choices=['regular', 'random'], default='random',
+                       help='evenly spaced or memoryless valid/ready stalls')
+    p_val.add_argument('--cycles', type=int, default=2000)
+    p_val.add_argument('--seed', type=int, default=0)
+    p_val.add_argument('--json', action='store_true', help='print the result as JSON')
+
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'estimate':
+        result = Pipeline.from_yaml(args.pipeline).estimate()
+        if args.json:
+            out = result.to_dict()
+            if args.iterations:
+                out['cycles'] = result.cycles(args.iterations)
+            print(json.dumps(out, indent=2))
+        else:
+            print(result.report())
+            if args.iterations:
+                print(f"cycles          : {result.cycles(args.iterations):.0f} "
+                      f"for {args.iterations} iterations")
+        return 0
+
+    rows = validate(stimulus=args.stimulus, cycles=args.cycles, seed=args.seed)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'dut':<6} {'valid rates':<24} {'ready rates':<24} "
+              f"{'predicted':>9} {'measured':>9} {'error':>8}")
+        for row in rows:
+            error = ("no xfer" if row['error'] is None
+                     else f"{row['error']*100:7.1f}%")
+            print(f"{row['dut']:<6} {str(row['valid_rates']):<24} {str(row['ready_rates']):<24} "
+                  f"{row['predicted']:9.4f} {row['measured']:9.4f} {error:>8}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,158 @@
+#---------------------------------
+# Copyright 2023 KULeuven
+# Solderpad Hardware License, Version 0.51, see LICENSE for details.
+# SPDX-License-Identifier: SHL-0.51
+#---------------------------------
+
+#-----------------------------------
+# Throughput measurement bench for the cocotb wrappers in
+# tests/cocotb/basic/wrappers, driven by `hwpe_stream_perf.py validate`.
+# All settings are passed through PERF_* environment variables.
+#-----------------------------------
+
+import os
+import json
+import random
+
+import  cocotb
+from    cocotb.triggers import RisingEdge, Timer
+from    cocotb.clock    import Clock
+
+#-----------------------------------
+# Stall generators
+#-----------------------------------
+# 'random' draws the stalls independently every cycle, i.e. memoryless
+# producers/consumers without backlog, which is the assumption of the
+# static model; 'regular' spreads them periodically with a credit
+# accumulator, so that the stalls of different lanes are correlated.
+#-----------------------------------
+class Throttle:
+
+    def __init__(self, rate, stimulus, rng):
+        self.rate     = rate
+        self.stimulus = stimulus
+        self.rng      = rng
+        self.credit   = 0.0
+
+    # producer side: returns the number of new tokens this cycle
+    def tick(self):
+        if self.stimulus == 'regular':
+            self.credit += self.rate
+            if self.credit >= 1.0:
+                self.credit -= 1.0
+                return 1
+            return 0
+        return 1 if self.rng.random() < self.rate else 0
+
+
+class Producer:
+
+    # valid is held until the handshake, as required by the HWPE-Stream protocol
+    def __init__(self, rate, stimulus, rng):
+        self.throttle = Throttle(rate, stimulus, rng)
+        self.backlog  = 0
+        self.memoryless = stimulus == 'random'
+
+    def valid(self):
+        if self.memoryless:
+            # at most one pending token, new ones are only drawn when idle
+            if self.backlog == 0:
+                self.backlog = self.throttle.tick()
+        else:
+            self.backlog += self.throttle.tick()
+        return 1 if self.backlog > 0 else 0
+
+    def handshake(self):
+        self.backlog -= 1
+
+
+class Consumer:
+
+    def __init__(self, rate, stimulus, rng):
+        self.throttle = Throttle(rate, stimulus, rng)
+
+    def ready(self):
+        return self.throttle.tick()
+
+
+def rates(name):
+    return [float(r) for r in os.environ[name].split(',')]
+
+
+@cocotb.test()
+async def hwpe_stream_perf(dut):
+
+    #-----------------------------------
+    # Settings
+    #-----------------------------------
+    DUT         = os.environ['PERF_DUT']
+    VALID_RATES = rates('PERF_VALID_RATES')
+    READY_RATES = rates('PERF_READY_RATES')
+    STIMULUS    = os.environ.get('PERF_STIMULUS', 'random')
+    CYCLES      = int(os.environ.get('PERF_CYCLES', '2000'))
+    rng         = random.Random(int(os.environ.get('PERF_SEED', '0')))
+
+    producers = [Producer(r, STIMULUS, rng) for r in VALID_RATES]
+    consumers = [Consumer(r, STIMULUS, rng) for r in READY_RATES]
+
+    # merge has many inputs and one output, split the opposite
+    if DUT == 'merge':
+        in_valid  = [dut.valid_i[i] for i in range(len(producers))]
+        in_ready  = [dut.ready_i[i] for i in range(len(producers))]
+        out_valid = [dut.valid_o]
+        out_ready = [dut.ready_o]
+    else:
+        in_valid  = [dut.valid_i]
+        in_ready  = [dut.ready_i]
+        out_valid = [dut.valid_o[i] for i in range(len(consumers))]
+        out_ready = [dut.ready_o[i] for i in range(len(consumers))]
+
+    #-----------------------------------
+    # Clock and reset
+    #-----------------------------------
+    clock = Clock(dut.clk_i, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    dut.rst_ni.value  = 0
+    dut.clear_i.value = 0
+    for sig in in_valid + out_ready:
+        sig.value = 0
+
+    await RisingEdge(dut.clk_i)
+    await RisingEdge(dut.clk_i)
+    dut.rst_ni.value = 1
+
+    #-----------------------------------
+    # Count transfers through the DUT
+    #-----------------------------------
+    # merge accepts a lane whenever the output is ready, and split
+    # broadcasts valid to every lane, so a single port can handshake without
+    # any data going through: only cycles where every input and every output
+    # handshakes are counted
+    #-----------------------------------
+    transfers = 0
+    for cycle in range(CYCLES):
+
+        for sig, producer in zip(in_valid, producers):
+            sig.value = producer.valid()
+        for sig, consumer in zip(out_ready, consumers):
+            sig.value = consumer.ready()
+
+        # merge/split are combinational, sample after the inputs settle
+        await Timer(1, units="ns")
+
+        in_hs  = [int(v.value) and int(r.value) for v, r in zip(in_valid, in_ready)]
+        out_hs = [int(v.value) and int(r.value) for v, r in zip(out_valid, out_ready)]
+        for hs, producer in zip(in_hs, producers):
+            if hs:
+                producer.handshake()
+        if all(in_hs) and all(out_hs):
+            transfers += 1
+
+        await RisingEdge(dut.clk_i)
+
+    throughput = transfers / CYCLES
+    cocotb.log.info(f'{DUT}: {transfers} transfers in {CYCLES} cycles ({throughput:.4f}/cycle)')
+
+    with open(os.environ['PERF_RESULT'], 'w') as f:
+        json.dump({'transfers': transfers, 'cycles': CYCLES, 'throughput': throughput}, f)